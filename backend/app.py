@@ -27,6 +27,13 @@ import time
 import json
 import re
 
+# orjson parses model responses several times faster than the stdlib decoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import backend modules
 from tax_constants import (
     FilingStatus, CONTRIBUTION_LIMITS_2025, PAY_PERIODS_PER_YEAR,
@@ -353,6 +360,20 @@ def fmt_currency(amount: float) -> str:
     return f"${amount:,.2f}"
 
 
+def parse_ai_json(ai_response: str) -> Any:
+    """Strip optional markdown code fences from a model response and parse the JSON."""
+    ai_response = ai_response.strip()
+    
+    if "```json" in ai_response:
+        ai_response = ai_response.split("```json")[1].split("```")[0]
+    elif "```" in ai_response:
+        ai_response = ai_response.split("```")[1].split("```")[0]
+    
+    if ORJSON_AVAILABLE:
+        return orjson.loads(ai_response)
+    return json.loads(ai_response)
+
+
 def calculate_projected_withholding(sources: List[Dict]) -> float:
     """Calculate projected year-end withholding from all sources."""
     total_withheld = 0
@@ -534,15 +555,7 @@ Return ONLY valid JSON."""
             ]
         )
         
-        ai_response = response.choices[0].message.content.strip()
-        
-        # Clean response
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0]
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0]
-        
-        data = json.loads(ai_response)
+        data = parse_ai_json(response.choices[0].message.content)
         
         # Ensure key financial values are positive
         for key in ['ytd_federal_withheld', 'current_federal_withheld', 'ytd_gross', 'current_gross_pay']:
@@ -608,14 +621,7 @@ Return ONLY the JSON array."""
             ]
         )
         
-        ai_response = response.choices[0].message.content.strip()
-        
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0]
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0]
-        
-        strategies = json.loads(ai_response)
+        strategies = parse_ai_json(response.choices[0].message.content)
         return strategies[:10]  # Ensure max 10
     except Exception as e:
         st.warning(f"Using fallback strategies: {e}")
@@ -684,14 +690,7 @@ Be specific with dollar amounts. Return ONLY valid JSON."""
             ]
         )
         
-        ai_response = response.choices[0].message.content.strip()
-        
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0]
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0]
-        
-        return json.loads(ai_response)
+        return parse_ai_json(response.choices[0].message.content)
     except Exception as e:
         return {"error": str(e)}
 
@@ -747,14 +746,7 @@ Return ONLY valid JSON with POSITIVE numbers."""
             ]
         )
         
-        ai_response = response.choices[0].message.content.strip()
-        
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0]
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0]
-        
-        parsed = json.loads(ai_response)
+        parsed = parse_ai_json(response.choices[0].message.content)
         
         # Ensure all values are positive
         for key in parsed:
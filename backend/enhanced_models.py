@@ -12,6 +12,7 @@ from datetime import date, datetime
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field, computed_field, model_validator
 from enum import Enum
+from operator import attrgetter
 import uuid
 
 from tax_constants import (
@@ -22,6 +23,13 @@ from tax_constants import (
 )
 
 
+# C-level field readers for the per-source totals below
+_get_ytd_gross = attrgetter("ytd_gross")
+_get_projected_income = attrgetter("projected_annual_income")
+_get_ytd_withheld = attrgetter("ytd_federal_withheld")
+_get_projected_withheld = attrgetter("projected_federal_withheld")
+
+
 # =============================================================================
 # ENUMS
 # =============================================================================
@@ -40,6 +48,18 @@ class IncomeSourceType(str, Enum):
     OTHER = "other"
 
 
+# Source-type groups used by the profile totals, built once for set lookups
+_W2_SOURCE_TYPES = frozenset({
+    IncomeSourceType.W2_PRIMARY,
+    IncomeSourceType.W2_SECONDARY,
+    IncomeSourceType.W2_SPOUSE,
+})
+_SELF_EMPLOYMENT_SOURCE_TYPES = frozenset({
+    IncomeSourceType.SELF_EMPLOYMENT,
+    IncomeSourceType.FORM_1099_NEC,
+})
+
+
 class PayFrequency(str, Enum):
     WEEKLY = "weekly"
     BIWEEKLY = "biweekly"
@@ -49,6 +69,11 @@ class PayFrequency(str, Enum):
     ANNUALLY = "annually"
 
 
+_PERIODS_BY_FREQUENCY: Dict[PayFrequency, int] = {
+    freq: PAY_PERIODS_PER_YEAR.get(freq.value, 26) for freq in PayFrequency
+}
+
+
 # =============================================================================
 # INCOME SOURCE MODEL
 # =============================================================================
@@ -106,7 +131,7 @@ class IncomeSource(BaseModel):
             return self.estimated_annual_amount
         
         if self.ytd_gross > 0 and self.current_pay_period > 0:
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = _PERIODS_BY_FREQUENCY[self.pay_frequency]
             return (self.ytd_gross / self.current_pay_period) * total_periods
         
         return self.estimated_annual_amount or self.ytd_gross
@@ -116,7 +141,7 @@ class IncomeSource(BaseModel):
     def projected_federal_withheld(self) -> float:
         """Project annual federal withholding from YTD data."""
         if self.ytd_federal_withheld > 0 and self.current_pay_period > 0:
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = _PERIODS_BY_FREQUENCY[self.pay_frequency]
             return (self.ytd_federal_withheld / self.current_pay_period) * total_periods
         return self.ytd_federal_withheld
 
@@ -136,22 +161,22 @@ class SpouseIncome(BaseModel):
     @computed_field
     @property
     def total_ytd_income(self) -> float:
-        return sum(s.ytd_gross for s in self.sources)
+        return sum(map(_get_ytd_gross, self.sources))
     
     @computed_field
     @property
     def total_projected_income(self) -> float:
-        return sum(s.projected_annual_income for s in self.sources)
+        return sum(map(_get_projected_income, self.sources))
     
     @computed_field
     @property
     def total_ytd_federal_withheld(self) -> float:
-        return sum(s.ytd_federal_withheld for s in self.sources)
+        return sum(map(_get_ytd_withheld, self.sources))
     
     @computed_field
     @property
     def total_projected_federal_withheld(self) -> float:
-        return sum(s.projected_federal_withheld for s in self.sources)
+        return sum(map(_get_projected_withheld, self.sources))
 
 
 # =============================================================================
@@ -369,14 +394,9 @@ class EnhancedUserProfile(BaseModel):
     @property
     def total_ytd_w2_income(self) -> float:
         """Total YTD W-2 income from all sources."""
-        w2_types = [
-            IncomeSourceType.W2_PRIMARY,
-            IncomeSourceType.W2_SECONDARY,
-            IncomeSourceType.W2_SPOUSE
-        ]
         total = sum(
             s.ytd_gross for s in self.income_sources 
-            if s.source_type in w2_types
+            if s.source_type in _W2_SOURCE_TYPES
         )
         if self.spouse:
             total += self.spouse.total_ytd_income
@@ -386,14 +406,9 @@ class EnhancedUserProfile(BaseModel):
     @property
     def total_projected_w2_income(self) -> float:
         """Projected annual W-2 income from all sources."""
-        w2_types = [
-            IncomeSourceType.W2_PRIMARY,
-            IncomeSourceType.W2_SECONDARY,
-            IncomeSourceType.W2_SPOUSE
-        ]
         total = sum(
             s.projected_annual_income for s in self.income_sources 
-            if s.source_type in w2_types
+            if s.source_type in _W2_SOURCE_TYPES
         )
         if self.spouse:
             total += self.spouse.total_projected_income
@@ -403,13 +418,9 @@ class EnhancedUserProfile(BaseModel):
     @property
     def total_self_employment_income(self) -> float:
         """Total self-employment income."""
-        se_types = [
-            IncomeSourceType.SELF_EMPLOYMENT,
-            IncomeSourceType.FORM_1099_NEC
-        ]
         return sum(
             s.projected_annual_income for s in self.income_sources 
-            if s.source_type in se_types
+            if s.source_type in _SELF_EMPLOYMENT_SOURCE_TYPES
         ) + self.business_income - self.business_expenses
     
     @computed_field
@@ -442,7 +453,7 @@ class EnhancedUserProfile(BaseModel):
     @property
     def total_ytd_federal_withheld(self) -> float:
         """Total YTD federal tax withheld from ALL sources."""
-        total = sum(s.ytd_federal_withheld for s in self.income_sources)
+        total = sum(map(_get_ytd_withheld, self.income_sources))
         if self.spouse:
             total += self.spouse.total_ytd_federal_withheld
         return total
@@ -451,7 +462,7 @@ class EnhancedUserProfile(BaseModel):
     @property
     def total_projected_federal_withheld(self) -> float:
         """Projected annual federal withholding from ALL sources."""
-        total = sum(s.projected_federal_withheld for s in self.income_sources)
+        total = sum(map(_get_projected_withheld, self.income_sources))
         if self.spouse:
             total += self.spouse.total_projected_federal_withheld
         return total
@@ -0,0 +1,106 @@
+"""
+TaxGuard AI - LLM Response Cache
+================================
+Deterministic cache for chat completions.
+
+Streamlit reruns the whole script on every widget change, so the same
+anonymized prompt would otherwise hit the API again and again. Responses are
+keyed by a SHA-256 of (model, messages) and kept in an in-memory LRU with a
+TTL; when a directory is given and `diskcache` is installed they also survive
+restarts.
+
+Only anonymized prompts reach this cache - PII is removed before any LLM call.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def make_cache_key(model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+    """Stable key for a chat request (params: extra request options, e.g. response_format)."""
+    request = {"model": model, "messages": messages}
+    if params:
+        request["params"] = params
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(request, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+class LLMCache:
+    """
+    LRU + TTL cache of LLM responses (stored as plain dicts).
+
+    Example:
+        cache = LLMCache(ttl=86400)
+        key = make_cache_key(model, messages)
+        hit = cache.get(key)
+    """
+
+    def __init__(self, ttl: float = 86400, max_entries: int = 512, directory: Optional[str] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = diskcache.Cache(directory) if directory and DISKCACHE_AVAILABLE else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached value for key, or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, value, now)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key for the configured TTL."""
+        self._remember(key, value, time.monotonic())
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self.ttl)
+
+    def clear(self) -> None:
+        """Drop every cached response (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def _remember(self, key: str, value: Dict[str, Any], now: float) -> None:
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
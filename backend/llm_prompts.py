@@ -13,6 +13,8 @@ CRITICAL RULES FOR LLM USAGE:
 The prompts in this module enforce these rules.
 """
 
+from typing import Any, Callable, Optional
+
 from tax_constants import get_all_constants_for_llm, get_tax_bracket_info, FilingStatus
 
 
@@ -371,77 +373,111 @@ Return only the fixed JSON:"""
 # PROMPT UTILITIES
 # =============================================================================
 
-def build_profile_summary(profile_data: dict) -> str:
-    """Build a human-readable summary of a profile for LLM prompts."""
+def _field_reader(data: Any, extras: Optional[dict] = None) -> Callable[[str, Any], Any]:
+    """
+    Return get(key, default) over a dict or a model object.
+    
+    Reading model attributes directly lets callers skip model_dump(), which
+    walks every field just to format a handful of them.
+    """
+    extras = extras or {}
+    if isinstance(data, dict):
+        lookup = data.get
+    else:
+        lookup = lambda key, default: getattr(data, key, default)
+    
+    def get(key: str, default: Any = None) -> Any:
+        if key in extras:
+            return extras[key]
+        return lookup(key, default)
+    
+    return get
+
+
+def build_profile_summary(profile_data: Any, extras: Optional[dict] = None) -> str:
+    """
+    Build a human-readable summary of a profile for LLM prompts.
+    
+    Args:
+        profile_data: UserFinancialProfile (or its model_dump() dict)
+        extras: Values not stored on the profile, e.g. total_pay_periods
+    """
+    get = _field_reader(profile_data, extras)
     
     lines = [
-        f"Filing Status: {profile_data.get('filing_status', 'unknown')}",
-        f"Age: {profile_data.get('age', 'unknown')}",
+        f"Filing Status: {get('filing_status', 'unknown')}",
+        f"Age: {get('age', 'unknown')}",
         f"",
         "=== INCOME ===",
-        f"YTD Gross Income: ${profile_data.get('ytd_income', 0):,.2f}",
-        f"Projected Annual Income: ${profile_data.get('projected_annual_income', 0):,.2f}",
-        f"Pay Frequency: {profile_data.get('pay_frequency', 'unknown')}",
-        f"Current Pay Period: {profile_data.get('current_pay_period', 'unknown')} of {profile_data.get('total_pay_periods', 'unknown')}",
+        f"YTD Gross Income: ${get('ytd_income', 0):,.2f}",
+        f"Projected Annual Income: ${get('projected_annual_income', 0):,.2f}",
+        f"Pay Frequency: {get('pay_frequency', 'unknown')}",
+        f"Current Pay Period: {get('current_pay_period', 'unknown')} of {get('total_pay_periods', 'unknown')}",
     ]
     
     # Other income
-    if profile_data.get('interest_income', 0) > 0:
-        lines.append(f"Interest Income: ${profile_data['interest_income']:,.2f}")
-    if profile_data.get('dividend_income', 0) > 0:
-        lines.append(f"Dividend Income: ${profile_data['dividend_income']:,.2f}")
-    if profile_data.get('capital_gains_long', 0) > 0:
-        lines.append(f"Long-term Capital Gains: ${profile_data['capital_gains_long']:,.2f}")
-    if profile_data.get('self_employment_income', 0) > 0:
-        lines.append(f"Self-Employment Income: ${profile_data['self_employment_income']:,.2f}")
+    if get('interest_income', 0) > 0:
+        lines.append(f"Interest Income: ${get('interest_income'):,.2f}")
+    if get('dividend_income', 0) > 0:
+        lines.append(f"Dividend Income: ${get('dividend_income'):,.2f}")
+    if get('capital_gains_long', 0) > 0:
+        lines.append(f"Long-term Capital Gains: ${get('capital_gains_long'):,.2f}")
+    if get('self_employment_income', 0) > 0:
+        lines.append(f"Self-Employment Income: ${get('self_employment_income'):,.2f}")
     
     lines.extend([
         "",
         "=== WITHHOLDING & PAYMENTS ===",
-        f"YTD Federal Withheld: ${profile_data.get('ytd_federal_withheld', 0):,.2f}",
-        f"Estimated Payments Made: ${profile_data.get('estimated_payments_made', 0):,.2f}",
+        f"YTD Federal Withheld: ${get('ytd_federal_withheld', 0):,.2f}",
+        f"Estimated Payments Made: ${get('estimated_payments_made', 0):,.2f}",
         "",
         "=== RETIREMENT CONTRIBUTIONS ===",
-        f"YTD 401(k): ${profile_data.get('ytd_401k_traditional', 0):,.2f}",
-        f"Remaining 401(k) Room: ${profile_data.get('remaining_401k_room', 0):,.2f}",
-        f"YTD HSA: ${profile_data.get('ytd_hsa', 0):,.2f}",
-        f"Remaining HSA Room: ${profile_data.get('remaining_hsa_room', 0):,.2f}",
+        f"YTD 401(k): ${get('ytd_401k_traditional', 0):,.2f}",
+        f"Remaining 401(k) Room: ${get('remaining_401k_room', 0):,.2f}",
+        f"YTD HSA: ${get('ytd_hsa', 0):,.2f}",
+        f"Remaining HSA Room: ${get('remaining_hsa_room', 0):,.2f}",
     ])
     
-    if profile_data.get('has_workplace_retirement_plan'):
+    if get('has_workplace_retirement_plan'):
         lines.append("Has Workplace Retirement Plan: Yes")
     
     return "\n".join(lines)
 
 
-def build_calculation_summary(result_data: dict) -> str:
-    """Build a human-readable summary of tax calculation results."""
+def build_calculation_summary(result_data: Any) -> str:
+    """
+    Build a human-readable summary of tax calculation results.
+    
+    Args:
+        result_data: TaxResult (or its model_dump() dict)
+    """
+    get = _field_reader(result_data)
     
-    refund_owed = result_data.get('refund_or_owed', 0)
+    refund_owed = get('refund_or_owed', 0)
     status = "REFUND" if refund_owed >= 0 else "OWES"
     
     lines = [
         "=== TAX CALCULATION RESULTS ===",
-        f"Gross Income: ${result_data.get('gross_income', 0):,.2f}",
-        f"Adjustments: ${result_data.get('adjustments', 0):,.2f}",
-        f"Adjusted Gross Income: ${result_data.get('adjusted_gross_income', 0):,.2f}",
+        f"Gross Income: ${get('gross_income', 0):,.2f}",
+        f"Adjustments: ${get('adjustments', 0):,.2f}",
+        f"Adjusted Gross Income: ${get('adjusted_gross_income', 0):,.2f}",
         f"",
-        f"Deduction Type: {result_data.get('deduction_type', 'standard').title()}",
-        f"Deduction Amount: ${result_data.get('deduction_amount', 0):,.2f}",
+        f"Deduction Type: {get('deduction_type', 'standard').title()}",
+        f"Deduction Amount: ${get('deduction_amount', 0):,.2f}",
         f"",
-        f"Taxable Income: ${result_data.get('taxable_income', 0):,.2f}",
+        f"Taxable Income: ${get('taxable_income', 0):,.2f}",
         f"",
-        f"Federal Tax: ${result_data.get('federal_tax', 0):,.2f}",
-        f"Self-Employment Tax: ${result_data.get('self_employment_tax', 0):,.2f}",
-        f"Total Credits: ${result_data.get('total_credits', 0):,.2f}",
+        f"Federal Tax: ${get('federal_tax', 0):,.2f}",
+        f"Self-Employment Tax: ${get('self_employment_tax', 0):,.2f}",
+        f"Total Credits: ${get('total_credits', 0):,.2f}",
         f"",
-        f"TOTAL TAX LIABILITY: ${result_data.get('total_tax_liability', 0):,.2f}",
-        f"Total Payments/Withholding: ${result_data.get('total_payments_and_withholding', 0):,.2f}",
+        f"TOTAL TAX LIABILITY: ${get('total_tax_liability', 0):,.2f}",
+        f"Total Payments/Withholding: ${get('total_payments_and_withholding', 0):,.2f}",
         f"",
         f"=== RESULT: {status} ${abs(refund_owed):,.2f} ===",
         f"",
-        f"Effective Tax Rate: {result_data.get('effective_rate', 0):.1f}%",
-        f"Marginal Tax Rate: {result_data.get('marginal_rate', 0)*100:.0f}%",
+        f"Effective Tax Rate: {get('effective_rate', 0):.1f}%",
+        f"Marginal Tax Rate: {get('marginal_rate', 0)*100:.0f}%",
     ]
     
     return "\n".join(lines)
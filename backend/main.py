@@ -12,22 +12,55 @@ Security Architecture:
 import os
 import json
 import base64
+import asyncio
 import logging
+import hashlib
+import tempfile
+import time
+import random
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from datetime import date, datetime
-from typing import Optional, Dict, Any, List
+from operator import attrgetter
+from typing import Optional, Dict, Any, List, Callable, Set, Tuple
 from contextlib import asynccontextmanager
 import uuid
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends, Request
+from fastapi.datastructures import Default
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import SchemaValidator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+try:
+    from openai import RateLimitError
+    RETRYABLE_LLM_ERRORS: tuple = (RateLimitError,)
+except ImportError:
+    RETRYABLE_LLM_ERRORS = ()
 
 # Local imports
-from tax_constants import FilingStatus, PAY_PERIODS_PER_YEAR, get_all_constants_for_llm
+from tax_constants import (
+    FilingStatus, TAX_BRACKETS_2025, STANDARD_DEDUCTION_2025,
+    CONTRIBUTION_LIMITS_2025, get_all_constants_for_llm
+)
 from models import (
     UserFinancialProfile,
     PayFrequency,
+    PAY_PERIODS_BY_FREQUENCY,
     TaxResult,
     RedactedDocument,
     DocumentType,
@@ -37,7 +70,7 @@ from models import (
     RecommendationReport,
     PaystubData,
 )
-from pii_redaction import PIIRedactor, redact_sensitive_data
+from pii_redaction import PIIRedactor, redact_sensitive_data, warmup as warmup_redaction
 from tax_simulator import TaxCalculator, TaxSimulator, RecommendationEngine, IncomeProjector
 from llm_prompts import (
     PAYSTUB_EXTRACTION_SYSTEM_PROMPT,
@@ -57,10 +90,57 @@ logger = logging.getLogger(__name__)
 # APPLICATION SETUP
 # =============================================================================
 
+class ExpiringStore(MutableMapping):
+    """
+    Dict-like in-memory store with a size cap and idle expiry.
+    
+    Entries expire ttl seconds after they were last read or written, and the
+    least recently used entry is dropped once maxsize is exceeded, so memory
+    tracks the active working set rather than every object ever created.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def _expire(self):
+        now = time.monotonic()
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+    
+    def __getitem__(self, key):
+        self._expire()
+        _, value = self._data[key]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __delitem__(self, key):
+        del self._data[key]
+    
+    def __iter__(self):
+        self._expire()
+        return iter(list(self._data))
+    
+    def __len__(self):
+        self._expire()
+        return len(self._data)
+
+
 # In-memory storage (replace with database in production)
-profiles_db: Dict[str, UserFinancialProfile] = {}
-documents_db: Dict[str, RedactedDocument] = {}
-processing_jobs: Dict[str, Dict[str, Any]] = {}
+profiles_db: "MutableMapping[str, UserFinancialProfile]" = ExpiringStore(maxsize=10_000, ttl=86400)
+documents_db: "MutableMapping[str, RedactedDocument]" = ExpiringStore(maxsize=10_000, ttl=86400)
+processing_jobs: "MutableMapping[str, Dict[str, Any]]" = ExpiringStore(maxsize=50_000, ttl=3600)
 
 
 @asynccontextmanager
@@ -68,15 +148,29 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     logger.info("TaxGuard AI starting up...")
     # Initialize components
+    if os.getenv("TAXGUARD_WARMUP") == "1":
+        # Load spaCy now rather than on the first uploaded document
+        await asyncio.to_thread(warmup_redaction, use_ner=True)
     yield
     logger.info("TaxGuard AI shutting down...")
 
 
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (several times faster than json.dumps)."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 app = FastAPI(
     title="TaxGuard AI",
     description="Privacy-first tax estimation API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Wrapped in Default() so routes with a response_model keep FastAPI's
+    # pydantic-core path that serializes straight to JSON bytes; untyped
+    # dict responses fall back to orjson.
+    default_response_class=Default(FastJSONResponse if ORJSON_AVAILABLE else JSONResponse)
 )
 
 # CORS middleware
@@ -176,6 +270,123 @@ Note: This is a mock response. In production, this would be generated by GPT-5.1
 llm_client = MockLLMClient()
 
 
+# =============================================================================
+# LLM RATE LIMITING
+# =============================================================================
+
+# Bound concurrent LLM calls and space them out so a burst of requests does
+# not trip provider throttling; 429s are retried with jittered backoff.
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+LLM_MIN_INTERVAL = 0.05  # Seconds between call starts
+LLM_MAX_RETRIES = 3
+
+_llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+_llm_interval_lock = asyncio.Lock()
+_llm_last_call = 0.0
+
+
+async def _wait_for_llm_slot():
+    """Sleep until LLM_MIN_INTERVAL has passed since the previous call started."""
+    global _llm_last_call
+    async with _llm_interval_lock:
+        delay = _llm_last_call + LLM_MIN_INTERVAL - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _llm_last_call = time.monotonic()
+
+
+async def call_llm_limited(method: Callable, *args, **kwargs):
+    """
+    Await an llm_client method under the global concurrency and rate limits.
+    
+    Rate-limit errors are retried up to LLM_MAX_RETRIES times with
+    exponential backoff; anything else propagates immediately.
+    """
+    async with _llm_semaphore:
+        for attempt in range(LLM_MAX_RETRIES):
+            await _wait_for_llm_slot()
+            try:
+                return await method(*args, **kwargs)
+            except RETRYABLE_LLM_ERRORS:
+                if attempt == LLM_MAX_RETRIES - 1:
+                    raise
+                backoff = (2 ** attempt) * 0.5 + random.random() * 0.1
+                logger.warning(f"LLM rate limited, retrying in {backoff:.2f}s")
+                await asyncio.sleep(backoff)
+
+
+# =============================================================================
+# CHUNKED EXTRACTION (long documents)
+# =============================================================================
+
+# Rough token budget per extraction call. Multi-page documents are split into
+# overlapping windows and extracted concurrently instead of overflowing the
+# model context in a single call.
+EXTRACTION_CHUNK_TOKENS = 6000
+EXTRACTION_CHUNK_OVERLAP = 200
+EXTRACTION_MAX_CONCURRENCY = 5
+CHARS_PER_TOKEN = 4  # Conservative estimate for English text
+
+
+def _split_by_tokens(
+    text: str,
+    max_tokens: int = EXTRACTION_CHUNK_TOKENS,
+    overlap: int = EXTRACTION_CHUNK_OVERLAP
+) -> List[str]:
+    """Split text into overlapping windows of roughly max_tokens tokens."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [text]
+    
+    step = max_chars - overlap * CHARS_PER_TOKEN
+    chunks = []
+    for start in range(0, len(text), step):
+        chunks.append(text[start:start + max_chars])
+        if start + max_chars >= len(text):
+            break
+    return chunks
+
+
+def _merge_paystub_results(results: List[dict]) -> dict:
+    """
+    Merge per-chunk paystub extractions into one result.
+    
+    Document-level fields come from the first chunk; any value the first
+    chunk left empty is filled from the first later chunk that found it.
+    """
+    merged = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in results[0].items()
+    }
+    
+    for result in results[1:]:
+        for section, values in result.items():
+            if not isinstance(values, dict):
+                continue
+            target = merged.setdefault(section, {})
+            for field, value in values.items():
+                if target.get(field) is None and value is not None:
+                    target[field] = value
+    
+    return merged
+
+
+async def extract_paystub_chunked(redacted_text: str) -> dict:
+    """Extract paystub data, fanning long documents out over concurrent calls."""
+    chunks = _split_by_tokens(redacted_text)
+    if len(chunks) == 1:
+        return await llm_client.extract_paystub_data(chunks[0])
+    
+    semaphore = asyncio.Semaphore(min(len(chunks), EXTRACTION_MAX_CONCURRENCY))
+    
+    async def extract(chunk: str) -> dict:
+        async with semaphore:
+            return await llm_client.extract_paystub_data(chunk)
+    
+    results = await asyncio.gather(*(extract(chunk) for chunk in chunks))
+    return _merge_paystub_results(results)
+
+
 # =============================================================================
 # OCR SERVICE (Mock - replace with Tesseract or cloud service)
 # =============================================================================
@@ -186,12 +397,12 @@ class OCRService:
     In production, use Tesseract, AWS Textract, or Google Document AI.
     """
     
-    async def extract_text(self, file_content: bytes, content_type: str) -> str:
+    async def extract_text(self, file_path: str, content_type: str) -> str:
         """
         Extract text from uploaded file.
         
         Args:
-            file_content: Raw file bytes
+            file_path: Path to the uploaded file on disk
             content_type: MIME type (application/pdf, image/png, etc.)
         
         Returns:
@@ -204,9 +415,8 @@ class OCRService:
             # Use pdfplumber or similar
             try:
                 import pdfplumber
-                import io
                 
-                with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+                with pdfplumber.open(file_path) as pdf:
                     text = ""
                     for page in pdf.pages:
                         text += page.extract_text() or ""
@@ -220,10 +430,9 @@ class OCRService:
             try:
                 import pytesseract
                 from PIL import Image
-                import io
                 
-                image = Image.open(io.BytesIO(file_content))
-                return pytesseract.image_to_string(image)
+                with Image.open(file_path) as image:
+                    return pytesseract.image_to_string(image)
             except ImportError:
                 logger.warning("pytesseract not installed")
                 return "[OCR placeholder - install pytesseract for image support]"
@@ -233,6 +442,57 @@ class OCRService:
 
 ocr_service = OCRService()
 
+# Calculation services are stateless between calls, so share one instance
+tax_calculator = TaxCalculator()
+recommendation_engine = RecommendationEngine()
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+# Backpressure for the document pipeline: at most OCR_CONCURRENCY documents
+# run OCR at once, and uploads are rejected with 429 once MAX_PENDING_DOCUMENTS
+# are queued or in flight, instead of piling up background tasks.
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", str(os.cpu_count() or 4)))
+MAX_PENDING_DOCUMENTS = int(os.getenv("MAX_PENDING_DOCUMENTS", "100"))
+
+_ocr_semaphore = asyncio.Semaphore(OCR_CONCURRENCY)
+_pending_documents = 0
+# Running pipeline tasks (asyncio only keeps weak references to tasks)
+_document_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _release_document_slot(task: "asyncio.Task[None]") -> None:
+    """Done callback: runs however the pipeline task ends, even if cancelled unstarted."""
+    global _pending_documents
+    _pending_documents -= 1
+    _document_tasks.discard(task)
+
+
+async def save_upload_to_temp(file: UploadFile) -> str:
+    """
+    Stream an upload to a temp file in UPLOAD_CHUNK_SIZE pieces.
+    
+    Returns:
+        Path of the temp file (caller is responsible for deleting it)
+    """
+    suffix = os.path.splitext(file.filename or "")[1]
+    fd, path = tempfile.mkstemp(prefix="taxguard_", suffix=suffix)
+    
+    try:
+        if AIOFILES_AVAILABLE:
+            os.close(fd)
+            async with aiofiles.open(path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await out.write(chunk)
+        else:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(out.write, chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    
+    return path
+
 
 # =============================================================================
 # REQUEST/RESPONSE MODELS
@@ -259,6 +519,10 @@ class SimulateRequest(BaseModel):
     scenario_name: Optional[str] = "Custom"
 
 
+class BatchCalculateRequest(BaseModel):
+    profile_ids: List[str] = Field(..., min_length=1, max_length=100)
+
+
 class ChatRequest(BaseModel):
     profile_id: str
     message: str
@@ -270,26 +534,150 @@ class UploadResponse(BaseModel):
     message: str
 
 
+# Hot JSON bodies are validated straight from the raw bytes by the model's
+# compiled validator - one pass in pydantic-core instead of FastAPI's
+# json.loads followed by a separate validation of the decoded dict.
+_SIMULATE_REQUEST_VALIDATOR = SimulateRequest.__pydantic_validator__
+_BATCH_CALCULATE_VALIDATOR = BatchCalculateRequest.__pydantic_validator__
+
+
+async def parse_json_body(request: Request, validator: SchemaValidator) -> Any:
+    """Validate a raw JSON request body, reporting failures as the usual 422."""
+    try:
+        return validator.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ])
+
+
+def json_body_openapi(model: type) -> Dict[str, Any]:
+    """openapi_extra describing a body that the endpoint parses itself."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
 class ProfileResponse(BaseModel):
     profile_id: str
-    profile: Dict[str, Any]
-    tax_result: Optional[Dict[str, Any]] = None
+    profile: UserFinancialProfile
+    tax_result: Optional[TaxResult] = None
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Value -> enum tables for strings coming back from the LLM. Unknown values
+# fall through to a default instead of raising inside the ingest pipeline.
+_DOC_TYPE_LOOKUP: Dict[str, DocumentType] = {t.value: t for t in DocumentType}
+_PAY_FREQ_LOOKUP: Dict[str, PayFrequency] = {f.value: f for f in PayFrequency}
+
+# Profile fields that need coercing to an enum before assignment
+_FIELD_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "filing_status": FilingStatus,
+    "pay_frequency": PayFrequency,
+}
+
+# Manual paystub entry: input key -> (profile field, preferred YTD input key)
+_MANUAL_PAYSTUB_FIELDS: Dict[str, Tuple[str, str]] = {
+    "gross_pay": ("ytd_income", "ytd_gross"),
+    "federal_tax": ("ytd_federal_withheld", "ytd_federal_tax"),
+    "current_period": ("current_pay_period", "current_period"),
+    "401k": ("ytd_401k_traditional", "ytd_401k"),
+    "hsa": ("ytd_hsa", "ytd_hsa"),
+}
+_MANUAL_INCOME_FIELDS = frozenset({
+    "interest_income", "dividend_income", "capital_gains_long",
+    "capital_gains_short", "self_employment_income", "other_income",
+})
+_MANUAL_DEDUCTION_FIELDS = frozenset({
+    "mortgage_interest", "state_local_taxes_paid",
+    "charitable_donations", "medical_expenses", "prefers_itemized",
+})
+
+
 def get_profile(profile_id: str) -> UserFinancialProfile:
     """Get profile or raise 404."""
-    if profile_id not in profiles_db:
+    # One lookup: a separate `in` check could pass just before the entry expires
+    profile = profiles_db.get(profile_id)
+    if profile is None:
         raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
-    return profiles_db[profile_id]
+    return profile
+
+
+# =============================================================================
+# PER-PROFILE-VERSION CACHES
+# =============================================================================
+
+# Derived results are keyed on (profile_id, updated_at). Every mutation path
+# bumps updated_at, so an unchanged profile is served from memory and a
+# changed one simply misses. Tax results need no entry here: TaxCalculator
+# already memoizes them by profile fingerprint.
+PROFILE_CACHE_SIZE = 512
+_recommendation_cache: "OrderedDict[Tuple[str, datetime, date], RecommendationReport]" = OrderedDict()
+_profile_summary_cache: "OrderedDict[Tuple[str, datetime], str]" = OrderedDict()
+_profile_json_cache: "OrderedDict[Tuple[str, datetime], bytes]" = OrderedDict()
+
+
+def _cached(cache: OrderedDict, key: tuple, compute: Callable[[], Any]) -> Any:
+    """Return cache[key], computing and storing it (LRU-bounded) on a miss."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+        return value
+    
+    value = compute()
+    cache[key] = value
+    if len(cache) > PROFILE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def generate_recommendations_cached(profile: UserFinancialProfile) -> RecommendationReport:
+    """Recommendation report for the current version of a profile."""
+    # Deadlines and days-until-year-end depend on today's date as well
+    return _cached(
+        _recommendation_cache,
+        (profile.profile_id, profile.updated_at, date.today()),
+        lambda: recommendation_engine.generate_recommendations(profile)
+    )
+
+
+def profile_response_json_cached(profile: UserFinancialProfile) -> bytes:
+    """Serialized ProfileResponse (profile + tax result) for the current version."""
+    return _cached(
+        _profile_json_cache,
+        (profile.profile_id, profile.updated_at),
+        lambda: ProfileResponse(
+            profile_id=profile.profile_id,
+            profile=profile,
+            tax_result=tax_calculator.calculate_tax(profile)
+        ).model_dump_json().encode()
+    )
+
+
+async def warm_recommendations(profile: UserFinancialProfile):
+    """Background task: populate the recommendation cache for a profile."""
+    generate_recommendations_cached(profile)
+
+
+def build_profile_summary_cached(profile: UserFinancialProfile) -> str:
+    """LLM profile summary for the current version of a profile."""
+    def build() -> str:
+        extras = {"total_pay_periods": PAY_PERIODS_BY_FREQUENCY[profile.pay_frequency]}
+        return build_profile_summary(profile, extras)
+    
+    return _cached(_profile_summary_cache, (profile.profile_id, profile.updated_at), build)
 
 
 async def process_document_pipeline(
     document_id: str,
-    file_content: bytes,
+    file_path: str,
     content_type: str,
     profile_id: str
 ):
@@ -300,67 +688,85 @@ async def process_document_pipeline(
     2. PII redaction
     3. LLM data extraction
     4. Profile update
+    
+    The uploaded file at file_path is deleted when the pipeline finishes.
     """
+    # The job record may expire while we work, so keep our own reference;
+    # writes to an evicted record are simply dropped
+    job = processing_jobs.get(document_id) or {}
+    
     try:
         # Update status
-        processing_jobs[document_id] = {
-            "status": ProcessingStatus.PROCESSING,
-            "started_at": datetime.utcnow()
-        }
+        job["status"] = ProcessingStatus.PROCESSING
+        job["started_at"] = datetime.utcnow()
+        processing_jobs[document_id] = job
         
         # Step 1: OCR
         logger.info(f"[{document_id}] Running OCR...")
-        raw_text = await ocr_service.extract_text(file_content, content_type)
+        async with _ocr_semaphore:
+            raw_text = await ocr_service.extract_text(file_path, content_type)
         
         # Step 2: PII Redaction (THE CRITICAL PRIVACY STEP)
         logger.info(f"[{document_id}] Redacting PII...")
-        processing_jobs[document_id]["status"] = ProcessingStatus.REDACTING
+        job["status"] = ProcessingStatus.REDACTING
         
         redactor = PIIRedactor(use_ner=True)
-        redaction_result = redactor.redact_sensitive_data(raw_text)
+        redaction_result = await redactor.aredact_sensitive_data(raw_text)
         
         # Store redacted document (never the original)
-        documents_db[document_id] = RedactedDocument(
+        document = RedactedDocument(
             document_id=document_id,
-            original_filename=processing_jobs[document_id].get("filename", "unknown"),
+            original_filename=job.get("filename", "unknown"),
             document_type=DocumentType.UNKNOWN,
             redacted_text=redaction_result.redacted_text,
             redaction_map=redaction_result.token_map,
             pii_found=list(redaction_result.pii_types_found),
             extraction_confidence=0.0
         )
+        documents_db[document_id] = document
         
         logger.info(f"[{document_id}] Redacted {redaction_result.redaction_count} PII items")
         
         # Step 3: Document Classification
         logger.info(f"[{document_id}] Classifying document...")
         classification = await llm_client.classify_document(redaction_result.redacted_text)
-        doc_type = DocumentType(classification.get("document_type", "unknown"))
-        documents_db[document_id].document_type = doc_type
+        doc_type = _DOC_TYPE_LOOKUP.get(classification.get("document_type"), DocumentType.UNKNOWN)
+        document = document.model_copy(update={"document_type": doc_type})
+        documents_db[document_id] = document
         
         # Step 4: LLM Data Extraction (on REDACTED text only)
         logger.info(f"[{document_id}] Extracting data via LLM...")
-        processing_jobs[document_id]["status"] = ProcessingStatus.EXTRACTING
+        job["status"] = ProcessingStatus.EXTRACTING
         
         if doc_type == DocumentType.PAYSTUB:
-            extracted = await llm_client.extract_paystub_data(redaction_result.redacted_text)
-            documents_db[document_id].extraction_confidence = extracted.get("extraction_confidence", 0)
+            extracted = await extract_paystub_chunked(redaction_result.redacted_text)
+            document = document.model_copy(
+                update={"extraction_confidence": extracted.get("extraction_confidence", 0)}
+            )
+            documents_db[document_id] = document
             
             # Update profile with extracted data
-            if profile_id in profiles_db:
-                profile = profiles_db[profile_id]
+            profile = profiles_db.get(profile_id)
+            if profile is not None:
                 update_profile_from_paystub(profile, extracted)
         
         # Mark complete
-        processing_jobs[document_id]["status"] = ProcessingStatus.COMPLETED
-        processing_jobs[document_id]["completed_at"] = datetime.utcnow()
+        job["status"] = ProcessingStatus.COMPLETED
+        job["completed_at"] = datetime.utcnow()
         
         logger.info(f"[{document_id}] Processing complete")
         
     except Exception as e:
         logger.error(f"[{document_id}] Processing failed: {e}")
-        processing_jobs[document_id]["status"] = ProcessingStatus.FAILED
-        processing_jobs[document_id]["error"] = str(e)
+        job["status"] = ProcessingStatus.FAILED
+        job["error"] = str(e)
+    
+    finally:
+        # Never keep the original (unredacted) document around
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
 
 
 def update_profile_from_paystub(profile: UserFinancialProfile, extracted: dict):
@@ -383,11 +789,9 @@ def update_profile_from_paystub(profile: UserFinancialProfile, extracted: dict):
         profile.ytd_hsa = ytd["hsa"]
     
     # Update pay frequency
-    if pay_info.get("pay_frequency"):
-        try:
-            profile.pay_frequency = PayFrequency(pay_info["pay_frequency"])
-        except ValueError:
-            pass
+    pay_frequency = _PAY_FREQ_LOOKUP.get(pay_info.get("pay_frequency"))
+    if pay_frequency is not None:
+        profile.pay_frequency = pay_frequency
     
     # Estimate current pay period from YTD and current period
     if current.get("gross_pay") and ytd.get("gross"):
@@ -398,6 +802,76 @@ def update_profile_from_paystub(profile: UserFinancialProfile, extracted: dict):
     profile.updated_at = datetime.utcnow()
 
 
+# =============================================================================
+# STATIC RESPONSES
+# =============================================================================
+
+# Reference data never changes at runtime, so these payloads are built once
+# at import instead of on every request.
+
+_ROOT_RESPONSE = {
+    "service": "TaxGuard AI",
+    "version": "1.0.0",
+    "status": "healthy",
+    "privacy_mode": "enabled"
+}
+
+
+def _bracket_rows(brackets: list) -> list:
+    return [
+        {"limit": b[0] if b[0] != float('inf') else "unlimited", "rate": b[1]}
+        for b in brackets
+    ]
+
+
+_BRACKETS_RESPONSE_BY_STATUS = {
+    status.value: {
+        "filing_status": status.value,
+        "brackets": _bracket_rows(brackets),
+        "standard_deduction": STANDARD_DEDUCTION_2025[status]
+    }
+    for status, brackets in TAX_BRACKETS_2025.items()
+}
+
+_BRACKETS_RESPONSE_ALL = {
+    status.value: {
+        "brackets": _bracket_rows(brackets),
+        "standard_deduction": STANDARD_DEDUCTION_2025[status]
+    }
+    for status, brackets in TAX_BRACKETS_2025.items()
+}
+
+# Reference payloads are serialized once and served with a content ETag and a
+# long-lived Cache-Control, so clients and CDNs can skip repeat downloads.
+REFERENCE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _static_json(payload: Any) -> Tuple[bytes, str]:
+    """Serialize a payload once and return (body, etag)."""
+    body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode()
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return body, etag
+
+
+def _static_json_response(request: Request, static: Tuple[bytes, str]) -> Response:
+    """Return a precomputed payload, or 304 if the client already has it."""
+    body, etag = static
+    headers = {"ETag": etag, "Cache-Control": REFERENCE_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+_BRACKETS_JSON_BY_STATUS = {
+    status: _static_json(payload) for status, payload in _BRACKETS_RESPONSE_BY_STATUS.items()
+}
+_BRACKETS_JSON_ALL = _static_json(_BRACKETS_RESPONSE_ALL)
+_LIMITS_JSON = _static_json(CONTRIBUTION_LIMITS_2025)
+
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
@@ -405,12 +879,7 @@ def update_profile_from_paystub(profile: UserFinancialProfile, extracted: dict):
 @app.get("/")
 async def root():
     """API health check."""
-    return {
-        "service": "TaxGuard AI",
-        "version": "1.0.0",
-        "status": "healthy",
-        "privacy_mode": "enabled"
-    }
+    return _ROOT_RESPONSE
 
 
 @app.get("/api/health")
@@ -449,7 +918,7 @@ async def create_profile(request: CreateProfileRequest):
     
     return ProfileResponse(
         profile_id=profile.profile_id,
-        profile=profile.model_dump()
+        profile=profile
     )
 
 
@@ -458,42 +927,31 @@ async def get_profile_endpoint(profile_id: str):
     """Get a profile by ID."""
     profile = get_profile(profile_id)
     
-    # Calculate current tax projection
-    calculator = TaxCalculator()
-    result = calculator.calculate_tax(profile)
-    
-    return ProfileResponse(
-        profile_id=profile_id,
-        profile=profile.model_dump(),
-        tax_result=result.model_dump()
-    )
+    # Profile plus current tax projection, serialized once per profile version
+    return Response(content=profile_response_json_cached(profile), media_type="application/json")
 
 
 @app.patch("/api/profiles/{profile_id}")
 async def update_profile(profile_id: str, request: UpdateProfileRequest):
     """Update profile fields."""
     profile = get_profile(profile_id)
+    updates = {}
     
     for key, value in request.updates.items():
         if hasattr(profile, key):
             # Handle special types
-            if key == "filing_status":
+            coerce = _FIELD_COERCERS.get(key)
+            if coerce is not None:
                 try:
-                    value = FilingStatus(value)
-                except ValueError:
-                    continue
-            elif key == "pay_frequency":
-                try:
-                    value = PayFrequency(value)
+                    value = coerce(value)
                 except ValueError:
                     continue
             
-            setattr(profile, key, value)
+            updates[key] = value
     
-    # Trigger recalculation
-    profile.updated_at = datetime.utcnow()
-    profile = profile.model_validate(profile.model_dump())
-    profiles_db[profile_id] = profile
+    # Validate the changes and trigger recalculation
+    updates["updated_at"] = datetime.utcnow()
+    profile.apply_updates(updates)
     
     return {"status": "updated", "profile_id": profile_id}
 
@@ -502,7 +960,6 @@ async def update_profile(profile_id: str, request: UpdateProfileRequest):
 
 @app.post("/api/documents/upload", response_model=UploadResponse)
 async def upload_document(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     profile_id: str = Form(...)
 ):
@@ -515,30 +972,55 @@ async def upload_document(
     3. LLM data extraction (on redacted text only)
     4. Profile update
     """
+    global _pending_documents
+    
     # Validate profile exists
     if profile_id not in profiles_db:
         raise HTTPException(status_code=404, detail="Profile not found")
     
-    # Read file content
-    content = await file.read()
-    document_id = str(uuid.uuid4())
+    if _pending_documents >= MAX_PENDING_DOCUMENTS:
+        raise HTTPException(
+            status_code=429,
+            detail="Document queue is full, please retry shortly",
+            headers={"Retry-After": "5"}
+        )
     
-    # Store job info
-    processing_jobs[document_id] = {
-        "status": ProcessingStatus.PENDING,
-        "filename": file.filename,
-        "profile_id": profile_id,
-        "created_at": datetime.utcnow()
-    }
+    # Take the slot before the first await, so concurrent uploads all see it
+    _pending_documents += 1
+    file_path = None
     
-    # Process in background
-    background_tasks.add_task(
-        process_document_pipeline,
-        document_id,
-        content,
-        file.content_type,
-        profile_id
-    )
+    try:
+        # Stream the upload to a temp file so memory stays bounded by chunk size
+        file_path = await save_upload_to_temp(file)
+        document_id = uuid.uuid4().hex
+        
+        # Store job info
+        processing_jobs[document_id] = {
+            "status": ProcessingStatus.PENDING,
+            "filename": file.filename,
+            "profile_id": profile_id,
+            "created_at": datetime.utcnow()
+        }
+        
+        # Process in background. A task (rather than a response background
+        # task) starts even if the response never reaches the client.
+        task = asyncio.create_task(process_document_pipeline(
+            document_id,
+            file_path,
+            file.content_type,
+            profile_id
+        ))
+    except BaseException:
+        # Not scheduled: give the slot back and drop the unredacted file
+        # (save_upload_to_temp already removed its own partial file)
+        _pending_documents -= 1
+        if file_path is not None:
+            os.remove(file_path)
+        raise
+    
+    # The task now owns the slot; the callback releases it when it finishes
+    _document_tasks.add(task)
+    task.add_done_callback(_release_document_slot)
     
     return UploadResponse(
         document_id=document_id,
@@ -550,10 +1032,10 @@ async def upload_document(
 @app.get("/api/documents/{document_id}/status")
 async def get_document_status(document_id: str):
     """Get processing status of a document."""
-    if document_id not in processing_jobs:
+    job = processing_jobs.get(document_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    job = processing_jobs[document_id]
     response = {
         "document_id": document_id,
         "status": job["status"].value if isinstance(job["status"], ProcessingStatus) else job["status"],
@@ -563,8 +1045,8 @@ async def get_document_status(document_id: str):
     if job.get("error"):
         response["error"] = job["error"]
     
-    if document_id in documents_db:
-        doc = documents_db[document_id]
+    doc = documents_db.get(document_id)
+    if doc is not None:
         response["document_type"] = doc.document_type.value
         response["pii_types_found"] = doc.pii_found
         response["extraction_confidence"] = doc.extraction_confidence
@@ -582,45 +1064,32 @@ async def manual_entry(profile_id: str, request: ManualEntryRequest):
     """
     profile = get_profile(profile_id)
     data = request.data
+    updates = {}
     
     if request.data_type == "paystub":
         # Update from manual paystub entry
-        if "gross_pay" in data:
-            profile.ytd_income = data.get("ytd_gross", data["gross_pay"])
-        if "federal_tax" in data:
-            profile.ytd_federal_withheld = data.get("ytd_federal_tax", data["federal_tax"])
+        for key in data.keys() & _MANUAL_PAYSTUB_FIELDS.keys():
+            field, ytd_key = _MANUAL_PAYSTUB_FIELDS[key]
+            updates[field] = data.get(ytd_key, data[key])
         if "pay_frequency" in data:
             try:
-                profile.pay_frequency = PayFrequency(data["pay_frequency"])
+                updates["pay_frequency"] = PayFrequency(data["pay_frequency"])
             except ValueError:
                 pass
-        if "current_period" in data:
-            profile.current_pay_period = data["current_period"]
-        if "401k" in data:
-            profile.ytd_401k_traditional = data.get("ytd_401k", data["401k"])
-        if "hsa" in data:
-            profile.ytd_hsa = data.get("ytd_hsa", data["hsa"])
     
     elif request.data_type == "income":
         # Update income sources
-        for field in ["interest_income", "dividend_income", "capital_gains_long", 
-                     "capital_gains_short", "self_employment_income", "other_income"]:
-            if field in data:
-                setattr(profile, field, data[field])
+        for field in data.keys() & _MANUAL_INCOME_FIELDS:
+            updates[field] = data[field]
     
     elif request.data_type == "deductions":
         # Update deductions
-        for field in ["mortgage_interest", "state_local_taxes_paid", 
-                     "charitable_donations", "medical_expenses"]:
-            if field in data:
-                setattr(profile, field, data[field])
-        if "prefers_itemized" in data:
-            profile.prefers_itemized = data["prefers_itemized"]
-    
-    # Recalculate
-    profile.updated_at = datetime.utcnow()
-    profile = profile.model_validate(profile.model_dump())
-    profiles_db[profile_id] = profile
+        for field in data.keys() & _MANUAL_DEDUCTION_FIELDS:
+            updates[field] = data[field]
+    
+    # Validate the changes and recalculate
+    updates["updated_at"] = datetime.utcnow()
+    profile.apply_updates(updates)
     
     return {"status": "updated", "profile_id": profile_id}
 
@@ -628,17 +1097,25 @@ async def manual_entry(profile_id: str, request: ManualEntryRequest):
 # --- TAX CALCULATION ---
 
 @app.post("/api/profiles/{profile_id}/calculate")
-async def calculate_tax(profile_id: str, include_recommendations: bool = True):
+async def calculate_tax(
+    profile_id: str,
+    background_tasks: BackgroundTasks,
+    include_recommendations: bool = True,
+    defer_recommendations: bool = False
+):
     """
     Calculate tax projection for a profile.
     
     This runs the ACTUAL tax calculation locally in Python.
     The LLM is NOT used for tax math.
+    
+    With defer_recommendations=true the tax result is returned right away
+    and recommendations are generated after the response; fetch them from
+    GET /api/profiles/{profile_id}/recommendations.
     """
     profile = get_profile(profile_id)
     
-    calculator = TaxCalculator()
-    result = calculator.calculate_tax(profile)
+    result = tax_calculator.calculate_tax(profile)
     
     response = {
         "profile_id": profile_id,
@@ -646,17 +1123,57 @@ async def calculate_tax(profile_id: str, include_recommendations: bool = True):
     }
     
     if include_recommendations:
-        engine = RecommendationEngine()
-        recommendations = engine.generate_recommendations(profile)
-        response["recommendations"] = recommendations.model_dump()
+        if defer_recommendations:
+            background_tasks.add_task(warm_recommendations, profile)
+            response["recommendations_pending"] = True
+        else:
+            recommendations = generate_recommendations_cached(profile)
+            response["recommendations"] = recommendations.model_dump()
     
     return response
 
 
+@app.get("/api/profiles/{profile_id}/recommendations")
+async def get_recommendations(profile_id: str):
+    """Get the recommendation report for the current version of a profile."""
+    profile = get_profile(profile_id)
+    recommendations = generate_recommendations_cached(profile)
+    
+    return {
+        "profile_id": profile_id,
+        "recommendations": recommendations.model_dump(),
+    }
+
+
+@app.post("/api/profiles/calculate:batch", openapi_extra=json_body_openapi(BatchCalculateRequest))
+async def calculate_tax_batch(http_request: Request):
+    """
+    Calculate tax projections for several profiles in one request.
+    
+    Saves dashboards N round-trips; unknown profile IDs are reported
+    in "not_found" instead of failing the whole batch.
+    """
+    request: BatchCalculateRequest = await parse_json_body(http_request, _BATCH_CALCULATE_VALIDATOR)
+    results = {}
+    not_found = []
+    
+    for profile_id in dict.fromkeys(request.profile_ids):
+        profile = profiles_db.get(profile_id)
+        if profile is None:
+            not_found.append(profile_id)
+            continue
+        results[profile_id] = tax_calculator.calculate_tax(profile).model_dump()
+    
+    return {
+        "results": results,
+        "not_found": not_found,
+    }
+
+
 # --- SIMULATION ---
 
-@app.post("/api/profiles/{profile_id}/simulate")
-async def run_simulation(profile_id: str, request: SimulateRequest):
+@app.post("/api/profiles/{profile_id}/simulate", openapi_extra=json_body_openapi(SimulateRequest))
+async def run_simulation(profile_id: str, http_request: Request):
     """
     Run a what-if simulation.
     
@@ -664,6 +1181,7 @@ async def run_simulation(profile_id: str, request: SimulateRequest):
     - {"extra_401k": 5000} - Add $5k more to 401k
     - {"filing_status": "married_filing_jointly"} - Change filing status
     """
+    request: SimulateRequest = await parse_json_body(http_request, _SIMULATE_REQUEST_VALIDATOR)
     profile = get_profile(profile_id)
     
     simulator = TaxSimulator(profile)
@@ -688,6 +1206,8 @@ async def find_optimal_scenario(profile_id: str):
     profile = get_profile(profile_id)
     simulator = TaxSimulator(profile)
     
+    # Run inline: the tax math holds the GIL, so threads would only add
+    # dispatch overhead, and the baseline is memoized after the first run
     scenarios = []
     
     # Max 401(k)
@@ -706,8 +1226,7 @@ async def find_optimal_scenario(profile_id: str):
         if profile.remaining_hsa_room > 0:
             combined_changes["extra_hsa"] = profile.remaining_hsa_room
         
-        combined_result = simulator.run_simulation(combined_changes, "Max All Pre-Tax")
-        scenarios.append(combined_result)
+        scenarios.append(simulator.run_simulation(combined_changes, "Max All Pre-Tax"))
     
     return {
         "scenarios": [
@@ -719,7 +1238,7 @@ async def find_optimal_scenario(profile_id: str):
             }
             for s in scenarios
         ],
-        "best_scenario": max(scenarios, key=lambda s: -s.tax_difference).scenario_name if scenarios else None
+        "best_scenario": min(scenarios, key=attrgetter("tax_difference")).scenario_name if scenarios else None
     }
 
 
@@ -740,20 +1259,15 @@ async def get_strategy_analysis(profile_id: str):
     profile = get_profile(profile_id)
     
     # Calculate tax (in Python)
-    calculator = TaxCalculator()
-    result = calculator.calculate_tax(profile)
+    result = tax_calculator.calculate_tax(profile)
     
     # Build summaries for LLM
-    profile_data = profile.model_dump()
-    profile_data["total_pay_periods"] = PAY_PERIODS_PER_YEAR[profile.pay_frequency.value]
-    profile_data["remaining_401k_room"] = profile.remaining_401k_room
-    profile_data["remaining_hsa_room"] = profile.remaining_hsa_room
-    
-    profile_summary = build_profile_summary(profile_data)
-    calculation_summary = build_calculation_summary(result.model_dump())
+    profile_summary = build_profile_summary_cached(profile)
+    calculation_summary = build_calculation_summary(result)
     
     # Get AI analysis
-    analysis = await llm_client.generate_strategy_analysis(
+    analysis = await call_llm_limited(
+        llm_client.generate_strategy_analysis,
         profile_summary,
         calculation_summary
     )
@@ -770,42 +1284,22 @@ async def get_strategy_analysis(profile_id: str):
 # --- TAX REFERENCE DATA ---
 
 @app.get("/api/reference/brackets")
-async def get_tax_brackets(filing_status: Optional[str] = None):
+async def get_tax_brackets(request: Request, filing_status: Optional[str] = None):
     """Get 2025 tax bracket information."""
-    from tax_constants import TAX_BRACKETS_2025, STANDARD_DEDUCTION_2025
-    
     if filing_status:
-        try:
-            status = FilingStatus(filing_status)
-            return {
-                "filing_status": status.value,
-                "brackets": [
-                    {"limit": b[0], "rate": b[1]}
-                    for b in TAX_BRACKETS_2025[status]
-                ],
-                "standard_deduction": STANDARD_DEDUCTION_2025[status]
-            }
-        except ValueError:
+        static = _BRACKETS_JSON_BY_STATUS.get(filing_status)
+        if static is None:
             raise HTTPException(status_code=400, detail="Invalid filing status")
+        return _static_json_response(request, static)
     
     # Return all
-    return {
-        status.value: {
-            "brackets": [
-                {"limit": b[0] if b[0] != float('inf') else "unlimited", "rate": b[1]}
-                for b in brackets
-            ],
-            "standard_deduction": STANDARD_DEDUCTION_2025[status]
-        }
-        for status, brackets in TAX_BRACKETS_2025.items()
-    }
+    return _static_json_response(request, _BRACKETS_JSON_ALL)
 
 
 @app.get("/api/reference/limits")
-async def get_contribution_limits():
+async def get_contribution_limits(request: Request):
     """Get 2025 contribution limits."""
-    from tax_constants import CONTRIBUTION_LIMITS_2025
-    return CONTRIBUTION_LIMITS_2025
+    return _static_json_response(request, _LIMITS_JSON)
 
 
 # --- ERROR HANDLERS ---
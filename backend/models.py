@@ -13,11 +13,15 @@ These models serve as the contract between:
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator, model_validator, computed_field
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, computed_field
+import hashlib
+import itertools
 import uuid
 
-from tax_constants import FilingStatus, PAY_PERIODS_PER_YEAR
+from tax_constants import (
+    FilingStatus, PAY_PERIODS_PER_YEAR, STANDARD_DEDUCTION_2025, CONTRIBUTION_LIMITS_2025
+)
 
 
 # =============================================================================
@@ -44,6 +48,12 @@ class PayFrequency(str, Enum):
     ANNUALLY = "annually"
 
 
+# Pay periods keyed by the enum itself, so hot paths skip the .value lookup
+PAY_PERIODS_BY_FREQUENCY: Dict[PayFrequency, int] = {
+    freq: PAY_PERIODS_PER_YEAR.get(freq.value, 26) for freq in PayFrequency
+}
+
+
 class ProcessingStatus(str, Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -76,6 +86,11 @@ class RecommendationCategory(str, Enum):
     GENERAL = "general"
 
 
+def _new_id() -> str:
+    """Random identifier for models (32 hex chars, no formatting pass)."""
+    return uuid.uuid4().hex
+
+
 # =============================================================================
 # INCOME SOURCE MODEL (for multiple jobs/spouses)
 # =============================================================================
@@ -85,15 +100,11 @@ class IncomeSource(BaseModel):
     Individual income source for supporting multiple jobs, spouse income, 
     1099 work, rental properties, etc.
     """
-    source_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    source_id: str = Field(default_factory=_new_id)
     source_name: str = "Primary Job"
-    source_type: str = Field(
-        default="w2",
-        pattern="^(w2|1099|self_employment|rental|investment|other)$"
-    )
-    owner: str = Field(
+    source_type: Literal["w2", "1099", "self_employment", "rental", "investment", "other"] = "w2"
+    owner: Literal["taxpayer", "spouse"] = Field(
         default="taxpayer",
-        pattern="^(taxpayer|spouse)$",
         description="Who earns this income"
     )
     
@@ -134,7 +145,7 @@ class IncomeSource(BaseModel):
     def projected_annual_income(self) -> float:
         """Project annual income based on YTD and pay period."""
         if self.source_type in ["w2", "1099"]:
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = PAY_PERIODS_BY_FREQUENCY[self.pay_frequency]
             if self.current_pay_period > 0:
                 return (self.ytd_income / self.current_pay_period) * total_periods
         return self.ytd_income
@@ -144,7 +155,7 @@ class IncomeSource(BaseModel):
     def projected_annual_withholding(self) -> float:
         """Project annual federal withholding."""
         if self.source_type == "w2":
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = PAY_PERIODS_BY_FREQUENCY[self.pay_frequency]
             if self.current_pay_period > 0:
                 return (self.ytd_federal_withheld / self.current_pay_period) * total_periods
         return self.ytd_federal_withheld
@@ -177,7 +188,7 @@ class RedactedDocument(BaseModel):
     Represents a document after PII has been stripped.
     This is what gets sent to the LLM - NEVER the original.
     """
-    document_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    document_id: str = Field(default_factory=_new_id)
     original_filename: str
     document_type: DocumentType
     redacted_text: str = Field(description="Text with all PII replaced by tokens")
@@ -197,8 +208,10 @@ class RedactedDocument(BaseModel):
     )
     processed_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        json_schema_extra = {
+    # Immutable once built; pipeline stages publish updates via model_copy
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "document_id": "abc123",
                 "original_filename": "paystub_oct.pdf",
@@ -209,15 +222,23 @@ class RedactedDocument(BaseModel):
                 "extraction_confidence": 0.95
             }
         }
+    )
 
 
 # =============================================================================
 # FINANCIAL DATA MODELS
 # =============================================================================
 
+# Money fields are float dollars throughout (extraction, profile, calculator,
+# UI). TaxCalculator rounds every reported amount to cents, so the float
+# representation never reaches the user; switching to integer cents would have
+# to happen in all of those layers at once.
+
 class PaystubData(BaseModel):
     """Structured data extracted from a single paystub."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Pay period info
     pay_date: Optional[date] = None
     pay_period_start: Optional[date] = None
@@ -279,6 +300,8 @@ class PaystubData(BaseModel):
 class W2Data(BaseModel):
     """Structured data from a W-2 form."""
     
+    model_config = ConfigDict(frozen=True, defer_build=True)
+    
     tax_year: int
     employer_name_token: str = "[EMPLOYER]"  # Redacted
     employer_ein_token: str = "[EIN]"  # Redacted
@@ -307,6 +330,8 @@ class W2Data(BaseModel):
 class Form1040Summary(BaseModel):
     """Key figures from a prior year 1040 for simulation."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     tax_year: int
     filing_status: FilingStatus
     
@@ -335,6 +360,111 @@ class Form1040Summary(BaseModel):
 # USER FINANCIAL PROFILE - CORE MODEL
 # =============================================================================
 
+def _standard_deduction(
+    filing_status: FilingStatus,
+    over_65: bool,
+    spouse_over_65: bool,
+    is_blind: bool,
+    spouse_is_blind: bool
+) -> float:
+    """Standard deduction including the age 65+ and blindness additions."""
+    base_deduction = STANDARD_DEDUCTION_2025.get(filing_status, 15000)
+    additional = 0
+    
+    # Unmarried filers get the larger per-condition addition
+    unmarried = filing_status in [FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD]
+    per_condition = 1950 if unmarried else 1550
+    
+    if over_65:
+        additional += per_condition
+    if spouse_over_65:
+        additional += 1550
+    if is_blind:
+        additional += per_condition
+    if spouse_is_blind:
+        additional += 1550
+    
+    return base_deduction + additional
+
+
+# Every (filing status, 65+, spouse 65+, blind, spouse blind) combination,
+# so profile validation does one dict lookup instead of the branch ladder
+_STANDARD_DEDUCTION_TABLE: Dict[tuple, float] = {
+    key: _standard_deduction(*key)
+    for key in itertools.product(FilingStatus, *[(False, True)] * 4)
+}
+
+
+# Contribution limits resolved once for the remaining-room properties
+_401K_LIMIT = CONTRIBUTION_LIMITS_2025["401k_employee"]
+_401K_LIMIT_50_PLUS = _401K_LIMIT + CONTRIBUTION_LIMITS_2025["401k_catch_up_50_plus"]
+_401K_LIMIT_60_TO_63 = _401K_LIMIT + CONTRIBUTION_LIMITS_2025["401k_catch_up_60_to_63"]
+_HSA_LIMIT_FAMILY = CONTRIBUTION_LIMITS_2025["hsa_family"]
+_HSA_LIMIT_INDIVIDUAL = CONTRIBUTION_LIMITS_2025["hsa_individual"]
+_HSA_CATCH_UP_55_PLUS = CONTRIBUTION_LIMITS_2025["hsa_catch_up_55_plus"]
+
+
+class _SourceTotals(NamedTuple):
+    """Aggregates over a profile's income_sources, computed in one pass."""
+    ytd_income: float
+    ytd_federal_withheld: float
+    ytd_401k_traditional: float
+    ytd_hsa: float
+    projected_annual_income: float
+    projected_annual_withholding: float
+    taxpayer_income: float
+    spouse_income: float
+    has_self_employment: bool
+
+
+def _aggregate_sources(sources: List[IncomeSource]) -> _SourceTotals:
+    ytd_income = ytd_withheld = ytd_401k = ytd_hsa = 0.0
+    projected_income = projected_withholding = 0.0
+    taxpayer_income = spouse_income = 0.0
+    has_self_employment = False
+    
+    for s in sources:
+        source_type = s.source_type
+        source_ytd = s.ytd_income
+        source_withheld = s.ytd_federal_withheld
+        ytd_income += source_ytd
+        ytd_withheld += source_withheld
+        ytd_401k += s.ytd_401k_traditional
+        ytd_hsa += s.ytd_hsa
+        
+        # Same projections as IncomeSource.projected_annual_income and
+        # projected_annual_withholding, sharing one period lookup per source
+        projected = source_ytd
+        projected_wh = source_withheld
+        pay_period = s.current_pay_period
+        if pay_period > 0 and (source_type == "w2" or source_type == "1099"):
+            total_periods = PAY_PERIODS_BY_FREQUENCY[s.pay_frequency]
+            projected = (source_ytd / pay_period) * total_periods
+            if source_type == "w2":
+                projected_wh = (source_withheld / pay_period) * total_periods
+        
+        projected_income += projected
+        projected_withholding += projected_wh
+        owner = s.owner
+        if owner == "taxpayer":
+            taxpayer_income += projected
+        elif owner == "spouse":
+            spouse_income += projected
+        if source_type == "self_employment":
+            has_self_employment = True
+    
+    return _SourceTotals(
+        ytd_income, ytd_withheld, ytd_401k, ytd_hsa,
+        projected_income, projected_withholding,
+        taxpayer_income, spouse_income, has_self_employment
+    )
+
+
+# Identity/bookkeeping fields that never affect tax math - left out of the
+# profile fingerprint so two snapshots with the same numbers share a cache key.
+_FINGERPRINT_EXCLUDE = {"profile_id", "created_at", "updated_at"}
+
+
 class UserFinancialProfile(BaseModel):
     """
     The standardized profile that unifies data from multiple sources.
@@ -343,7 +473,7 @@ class UserFinancialProfile(BaseModel):
     Supports multiple income sources (multiple jobs, spouse income, 1099s, rental, etc.)
     """
     
-    profile_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    profile_id: str = Field(default_factory=_new_id)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -396,7 +526,7 @@ class UserFinancialProfile(BaseModel):
     
     # Health Savings
     ytd_hsa: float = Field(default=0.0, ge=0)
-    hsa_coverage_type: Optional[str] = Field(default="individual", pattern="^(individual|family)$")
+    hsa_coverage_type: Optional[Literal["individual", "family"]] = "individual"
     hsa_eligible: bool = True
     
     # Deduction Preferences
@@ -429,7 +559,7 @@ class UserFinancialProfile(BaseModel):
     ev_purchase_planned: bool = False
     
     # Risk tolerance for advanced strategies
-    risk_tolerance: str = Field(default="moderate", pattern="^(conservative|moderate|aggressive)$")
+    risk_tolerance: Literal["conservative", "moderate", "aggressive"] = "moderate"
     open_to_lifestyle_changes: bool = True
     
     # Calculated standard deduction
@@ -438,72 +568,85 @@ class UserFinancialProfile(BaseModel):
     # State
     state_of_residence: Optional[str] = Field(default=None, max_length=2)
     
-    # Source tracking
-    data_sources: List[str] = Field(default_factory=list)
+    # Source tracking (the shared empty tuple saves a list per profile)
+    data_sources: Tuple[str, ...] = ()
     confidence_score: float = Field(default=0.0, ge=0, le=1)
     last_document_processed: Optional[str] = None
     
     @model_validator(mode='after')
     def calculate_projections(self):
         """Auto-calculate projected values based on YTD data and income sources."""
-        from tax_constants import PAY_PERIODS_PER_YEAR, STANDARD_DEDUCTION_2025
-        
         # =======================================================================
         # AGGREGATE INCOME FROM MULTIPLE SOURCES
         # =======================================================================
         if self.income_sources:
-            # Sum up YTD income from all sources
-            total_ytd_income = sum(s.ytd_income for s in self.income_sources)
-            total_ytd_withheld = sum(s.ytd_federal_withheld for s in self.income_sources)
-            total_ytd_401k = sum(s.ytd_401k_traditional for s in self.income_sources)
-            total_ytd_hsa = sum(s.ytd_hsa for s in self.income_sources)
+            # One pass over the sources; the computed fields below read these
+            totals = _aggregate_sources(self.income_sources)
             
             # Update legacy fields if they're at default
             if self.ytd_income == 0:
-                self.ytd_income = total_ytd_income
+                self.ytd_income = totals.ytd_income
             if self.ytd_federal_withheld == 0:
-                self.ytd_federal_withheld = total_ytd_withheld
+                self.ytd_federal_withheld = totals.ytd_federal_withheld
             if self.ytd_401k_traditional == 0:
-                self.ytd_401k_traditional = total_ytd_401k
+                self.ytd_401k_traditional = totals.ytd_401k_traditional
             if self.ytd_hsa == 0:
-                self.ytd_hsa = total_ytd_hsa
+                self.ytd_hsa = totals.ytd_hsa
             
             # Calculate projected annual income from all sources
-            total_projected = sum(s.projected_annual_income for s in self.income_sources)
-            self.projected_annual_income = total_projected
+            self.projected_annual_income = totals.projected_annual_income
         else:
             # Single source: use legacy calculation
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = PAY_PERIODS_BY_FREQUENCY[self.pay_frequency]
             if self.current_pay_period > 0 and self.ytd_income > 0:
                 self.projected_annual_income = (self.ytd_income / self.current_pay_period) * total_periods
         
-        # Calculate standard deduction
-        base_deduction = STANDARD_DEDUCTION_2025.get(self.filing_status, 15000)
-        additional = 0
+        # Standard deduction incl. age 65+ / blindness additions
+        self.standard_deduction = _STANDARD_DEDUCTION_TABLE[(
+            self.filing_status,
+            bool(self.age and self.age >= 65),
+            bool(self.spouse_age and self.spouse_age >= 65),
+            self.is_blind,
+            self.spouse_is_blind,
+        )]
         
-        # Add additional deduction for age 65+
-        if self.age and self.age >= 65:
-            if self.filing_status in [FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD]:
-                additional += 1950
-            else:
-                additional += 1550
+        return self
+    
+    def _totals(self) -> _SourceTotals:
+        """
+        Income source aggregates, computed live on each call.
         
-        if self.spouse_age and self.spouse_age >= 65:
-            additional += 1550
+        Not cached: income_sources (and the sources in it) can be edited in
+        place, which no validator sees.
+        """
+        return _aggregate_sources(self.income_sources)
+    
+    def apply_updates(self, updates: Dict[str, Any]) -> None:
+        """
+        Validate and set several fields in place.
         
-        # Add for blindness
-        if self.is_blind:
-            if self.filing_status in [FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD]:
-                additional += 1950
-            else:
-                additional += 1550
+        Each value goes through its field validator and the projections are
+        refreshed, without dumping and re-parsing the whole profile.
         
-        if self.spouse_is_blind:
-            additional += 1550
+        All-or-nothing: the updates are validated on a shallow copy first, so
+        an invalid value raises ValidationError with this profile unchanged.
+        """
+        staged = self.model_copy()
+        for field_name, value in updates.items():
+            staged.__pydantic_validator__.validate_assignment(staged, field_name, value)
         
-        self.standard_deduction = base_deduction + additional
+        self.__dict__.update(staged.__dict__)
+        self.__pydantic_fields_set__.update(staged.__pydantic_fields_set__)
+    
+    def fingerprint(self) -> bytes:
+        """
+        Stable digest of every tax-relevant field in this profile.
         
-        return self
+        Used as a cache key for tax calculations: any change to the inputs
+        produces a new fingerprint, so cached results never go stale.
+        """
+        payload = self.model_dump_json(exclude=_FINGERPRINT_EXCLUDE)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
     
     @computed_field
     @property
@@ -519,10 +662,10 @@ class UserFinancialProfile(BaseModel):
         This is CRITICAL for determining if user will owe or get refund.
         """
         if self.income_sources:
-            return sum(s.projected_annual_withholding for s in self.income_sources)
+            return self._totals().projected_annual_withholding
         else:
             # Single source projection
-            total_periods = PAY_PERIODS_PER_YEAR.get(self.pay_frequency.value, 26)
+            total_periods = PAY_PERIODS_BY_FREQUENCY[self.pay_frequency]
             if self.current_pay_period > 0:
                 return (self.ytd_federal_withheld / self.current_pay_period) * total_periods
             return self.ytd_federal_withheld
@@ -538,7 +681,7 @@ class UserFinancialProfile(BaseModel):
     def taxpayer_income(self) -> float:
         """Total income for primary taxpayer."""
         if self.income_sources:
-            return sum(s.projected_annual_income for s in self.income_sources if s.owner == "taxpayer")
+            return self._totals().taxpayer_income
         return self.projected_annual_income
     
     @computed_field
@@ -546,7 +689,7 @@ class UserFinancialProfile(BaseModel):
     def spouse_income(self) -> float:
         """Total income for spouse (if married)."""
         if self.income_sources:
-            return sum(s.projected_annual_income for s in self.income_sources if s.owner == "spouse")
+            return self._totals().spouse_income
         return 0.0
     
     @computed_field
@@ -554,33 +697,29 @@ class UserFinancialProfile(BaseModel):
     def has_self_employment(self) -> bool:
         """Check if any income source is self-employment."""
         if self.income_sources:
-            return any(s.source_type == "self_employment" for s in self.income_sources)
+            return self._totals().has_self_employment
         return self.self_employment_income > 0 or self.has_side_business
     
     @computed_field
     @property
     def remaining_401k_room(self) -> float:
         """Remaining 401k contribution room for the year."""
-        from tax_constants import CONTRIBUTION_LIMITS_2025
-        limit = CONTRIBUTION_LIMITS_2025["401k_employee"]
-        if self.age and self.age >= 50:
-            if self.age >= 60 and self.age <= 63:
-                limit += CONTRIBUTION_LIMITS_2025["401k_catch_up_60_to_63"]
-            else:
-                limit += CONTRIBUTION_LIMITS_2025["401k_catch_up_50_plus"]
+        age = self.age
+        if not age or age < 50:
+            limit = _401K_LIMIT
+        elif 60 <= age <= 63:
+            limit = _401K_LIMIT_60_TO_63
+        else:
+            limit = _401K_LIMIT_50_PLUS
         return max(0, limit - self.ytd_401k_traditional)
     
     @computed_field
     @property
     def remaining_hsa_room(self) -> float:
         """Remaining HSA contribution room for the year."""
-        from tax_constants import CONTRIBUTION_LIMITS_2025
-        if self.hsa_coverage_type == "family":
-            limit = CONTRIBUTION_LIMITS_2025["hsa_family"]
-        else:
-            limit = CONTRIBUTION_LIMITS_2025["hsa_individual"]
+        limit = _HSA_LIMIT_FAMILY if self.hsa_coverage_type == "family" else _HSA_LIMIT_INDIVIDUAL
         if self.age and self.age >= 55:
-            limit += CONTRIBUTION_LIMITS_2025["hsa_catch_up_55_plus"]
+            limit += _HSA_CATCH_UP_55_PLUS
         return max(0, limit - self.ytd_hsa)
 
 
@@ -590,6 +729,8 @@ class UserFinancialProfile(BaseModel):
 
 class TaxBracketBreakdown(BaseModel):
     """Details of tax calculation per bracket."""
+    model_config = ConfigDict(frozen=True)
+    
     bracket_start: float
     bracket_end: float
     rate: float
@@ -600,6 +741,9 @@ class TaxBracketBreakdown(BaseModel):
 class TaxResult(BaseModel):
     """Complete tax calculation result."""
     
+    # Results are memoized and shared between requests, so they are read-only
+    model_config = ConfigDict(frozen=True)
+    
     # Income summary
     gross_income: float
     adjustments: float
@@ -641,6 +785,8 @@ class TaxResult(BaseModel):
 
 class SimulationChange(BaseModel):
     """A single change to apply in a simulation."""
+    model_config = ConfigDict(defer_build=True)
+    
     field: str
     value: float
     description: str
@@ -648,6 +794,8 @@ class SimulationChange(BaseModel):
 
 class SimulationScenario(BaseModel):
     """A named scenario with multiple changes."""
+    model_config = ConfigDict(defer_build=True)
+    
     name: str
     description: str
     changes: List[SimulationChange]
@@ -677,7 +825,9 @@ class SimulationResult(BaseModel):
 class TaxRecommendation(BaseModel):
     """A single tax optimization recommendation."""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(frozen=True)
+    
+    id: str = Field(default_factory=_new_id)
     priority: RecommendationPriority
     category: RecommendationCategory
     
@@ -700,11 +850,11 @@ class TaxRecommendation(BaseModel):
     is_mathematically_feasible: bool = True
     
     # Complexity
-    complexity: str = Field(default="basic", pattern="^(basic|intermediate|advanced)$")
+    complexity: Literal["basic", "intermediate", "advanced"] = "basic"
     requires_professional: bool = False
     
     # Warnings
-    warnings: List[str] = Field(default_factory=list)
+    warnings: Tuple[str, ...] = ()
     
     @computed_field
     @property
@@ -746,6 +896,8 @@ class RecommendationReport(BaseModel):
 
 class DocumentUploadRequest(BaseModel):
     """Request to upload a document for processing."""
+    model_config = ConfigDict(defer_build=True)
+    
     filename: str
     content_type: str
     document_type_hint: Optional[DocumentType] = None
@@ -753,6 +905,8 @@ class DocumentUploadRequest(BaseModel):
 
 class DocumentUploadResponse(BaseModel):
     """Response after document upload."""
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: str
     status: ProcessingStatus
     message: str
@@ -760,6 +914,8 @@ class DocumentUploadResponse(BaseModel):
 
 class ProfileUpdateRequest(BaseModel):
     """Request to manually update profile fields."""
+    model_config = ConfigDict(defer_build=True)
+    
     updates: Dict[str, Any]
 
 
@@ -772,12 +928,16 @@ class SimulationRequest(BaseModel):
 
 class CalculationRequest(BaseModel):
     """Request for tax calculation."""
+    model_config = ConfigDict(defer_build=True)
+    
     profile_id: str
     include_recommendations: bool = True
 
 
 class CalculationResponse(BaseModel):
     """Response with tax calculation and recommendations."""
+    model_config = ConfigDict(defer_build=True)
+    
     profile: UserFinancialProfile
     result: TaxResult
     recommendations: Optional[RecommendationReport] = None
@@ -11,27 +11,94 @@ Uses GPT-5.1 (OpenAI's latest frontier model with adaptive reasoning) for:
 IMPORTANT: All data sent to OpenAI has PII removed via the Privacy Air Gap.
 """
 
+import io
 import os
 import json
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+import asyncio
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator
+from dataclasses import dataclass, asdict
 from enum import Enum
 import streamlit as st
 
+from llm_cache import LLMCache, make_cache_key
+
+# orjson formats the prompt payloads several times faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import OpenAI
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
 
+# =============================================================================
+# SHARED HTTP CLIENT
+# =============================================================================
+
+# One pooled connection set for the whole process: every Streamlit session
+# reuses warm keep-alive connections instead of paying a TCP+TLS handshake.
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 50
+# Per-attempt cap: a tail-latency outlier is abandoned and retried instead
+# of holding the page for the SDK's default ten minutes
+HTTP_TIMEOUT = 30.0
+HTTP_CONNECT_TIMEOUT = 5.0
+# Retries of transient failures (429, 5xx, connection errors, timeouts),
+# with the SDK's exponential backoff, jitter and Retry-After handling
+MAX_RETRIES = 3
+
+_shared_clients: Dict[str, "OpenAI"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _http_limits() -> "httpx.Limits":
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE
+    )
+
+
+def _http_timeout() -> "httpx.Timeout":
+    return httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+
+
+def get_shared_openai_client(api_key: str) -> "OpenAI":
+    """Process-wide OpenAI client for an API key, over one pooled httpx.Client."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            http_client = httpx.Client(limits=_http_limits(), timeout=_http_timeout())
+            client = OpenAI(
+                api_key=api_key,
+                http_client=http_client,
+                timeout=_http_timeout(),
+                max_retries=MAX_RETRIES
+            )
+            _shared_clients[api_key] = client
+        return client
+
+
+def dumps_pretty(obj: Any) -> str:
+    """JSON with two-space indentation, for embedding data in prompts."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 class AIProvider(Enum):
     OPENAI = "openai"
     MOCK = "mock"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """Response from AI model."""
     content: str
@@ -86,17 +153,40 @@ class TaxAIClient:
     - Mock responses (fallback when no API key)
     """
     
+    # Max in-flight requests for run_many (keeps bursts under rate limits)
+    DEFAULT_CONCURRENCY = 4
+    
+    # Identical prompts (e.g. on Streamlit reruns) are answered from cache
+    RESPONSE_CACHE_TTL = 86400
+    
+    # call_multi packs tasks into one request only up to this many prompt
+    # characters; quality drops on long multi-task prompts
+    MULTI_TASK_MAX_CHARS = 12000
+    
     def __init__(self):
         self.provider = AIProvider.MOCK
         self.client = None
+        self.aclient = None
         self.model = "gpt-5.1"  # OpenAI's latest frontier model with adaptive reasoning
+        self.cache = LLMCache(
+            ttl=self.RESPONSE_CACHE_TTL,
+            directory=os.environ.get("TAXGUARD_LLM_CACHE_DIR")
+        )
         
         # Check for OpenAI API key
         api_key = self._get_api_key()
         
         if api_key and OPENAI_AVAILABLE:
             try:
-                self.client = OpenAI(api_key=api_key)
+                self.client = get_shared_openai_client(api_key)
+                # Not shared: async connections belong to the event loop that
+                # opened them, and each asyncio.run() starts a new loop
+                self.aclient = AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=httpx.AsyncClient(limits=_http_limits(), timeout=_http_timeout()),
+                    timeout=_http_timeout(),
+                    max_retries=MAX_RETRIES
+                )
                 self.provider = AIProvider.OPENAI
             except Exception as e:
                 print(f"Failed to initialize OpenAI client: {e}")
@@ -119,6 +209,16 @@ class TaxAIClient:
         """Check if connected to real AI provider."""
         return self.provider == AIProvider.OPENAI and self.client is not None
     
+    @property
+    def cache_hits(self) -> int:
+        """Calls answered from the response cache."""
+        return self.cache.hits
+    
+    @property
+    def cache_misses(self) -> int:
+        """Calls that went to the API."""
+        return self.cache.misses
+    
     def generate_strategies(
         self,
         anonymized_profile: Dict[str, Any],
@@ -168,22 +268,9 @@ class TaxAIClient:
         Returns:
             AIResponse with analysis
         """
-        user_prompt = f"""
-SCENARIO TO ANALYZE:
-{scenario_description}
-
-CURRENT FINANCIAL SITUATION:
-{json.dumps(anonymized_profile, indent=2)}
-
-CURRENT TAX CALCULATION:
-{json.dumps(current_tax_result, indent=2)}
-
-Please analyze this scenario and provide:
-1. How it would affect the tax situation
-2. Specific recommendations
-3. Potential savings or costs
-4. Any risks or considerations
-"""
+        user_prompt = self._build_scenario_prompt(
+            scenario_description, anonymized_profile, current_tax_result
+        )
         
         if self.provider == AIProvider.OPENAI:
             return self._call_openai(
@@ -208,13 +295,66 @@ Please analyze this scenario and provide:
         Returns:
             AIResponse with explanation
         """
-        user_prompt = f"""
+        user_prompt = self._build_explanation_prompt(strategy_name, anonymized_profile)
+        
+        if self.provider == AIProvider.OPENAI:
+            return self._call_openai(
+                system_prompt=TAX_STRATEGY_SYSTEM_PROMPT,
+                user_prompt=user_prompt
+            )
+        else:
+            return self._mock_explanation_response(strategy_name)
+    
+    def stream_explanation(
+        self,
+        strategy_name: str,
+        anonymized_profile: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Streaming version of explain_strategy, for st.write_stream.
+        
+        Example:
+            text = st.write_stream(client.stream_explanation(name, profile))
+        """
+        if self.provider != AIProvider.OPENAI:
+            yield self._mock_explanation_response(strategy_name).content
+            return
+        user_prompt = self._build_explanation_prompt(strategy_name, anonymized_profile)
+        yield from self.stream_openai(TAX_STRATEGY_SYSTEM_PROMPT, user_prompt)
+    
+    def _build_scenario_prompt(
+        self,
+        scenario_description: str,
+        profile: Dict[str, Any],
+        tax_result: Dict[str, Any]
+    ) -> str:
+        """Build the scenario analysis prompt."""
+        return f"""
+SCENARIO TO ANALYZE:
+{scenario_description}
+
+CURRENT FINANCIAL SITUATION:
+{dumps_pretty(profile)}
+
+CURRENT TAX CALCULATION:
+{dumps_pretty(tax_result)}
+
+Please analyze this scenario and provide:
+1. How it would affect the tax situation
+2. Specific recommendations
+3. Potential savings or costs
+4. Any risks or considerations
+"""
+    
+    def _build_explanation_prompt(self, strategy_name: str, profile: Dict[str, Any]) -> str:
+        """Build the strategy explanation prompt."""
+        return f"""
 Please explain the following tax strategy in detail, specifically as it applies to someone in this financial situation:
 
 STRATEGY: {strategy_name}
 
 FINANCIAL CONTEXT:
-{json.dumps(anonymized_profile, indent=2)}
+{dumps_pretty(profile)}
 
 Provide:
 1. How this strategy works
@@ -224,14 +364,6 @@ Provide:
 5. Potential pitfalls to avoid
 6. Timeline and deadlines
 """
-        
-        if self.provider == AIProvider.OPENAI:
-            return self._call_openai(
-                system_prompt=TAX_STRATEGY_SYSTEM_PROMPT,
-                user_prompt=user_prompt
-            )
-        else:
-            return self._mock_explanation_response(strategy_name)
     
     def _build_strategy_prompt(
         self,
@@ -249,7 +381,7 @@ Provide:
         
         return f"""
 ANONYMIZED FINANCIAL PROFILE {sources_note}:
-{json.dumps(profile, indent=2)}
+{dumps_pretty(profile)}
 
 CURRENT TAX CALCULATION (based on all income sources combined):
 - Total Gross Income: ${tax_result.get('gross_income', 0):,.2f}
@@ -270,27 +402,58 @@ Focus on strategies that can be implemented before year-end if applicable.
     def _call_openai(
         self,
         system_prompt: str,
-        user_prompt: str
+        user_prompt: str,
+        **params: Any
     ) -> AIResponse:
-        """Make a call to OpenAI API."""
+        """Make a call to OpenAI API (served from the response cache if seen before)."""
+        # System prompt stays first and unchanged so OpenAI's prompt caching applies too
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        key = make_cache_key(self.model, messages, **params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIResponse(**cached)
+        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
+                messages=messages,
+                **params
                 # No temperature or max_tokens as requested
             )
-            
+            return self._cache_response(key, response)
+        except Exception as e:
             return AIResponse(
-                content=response.choices[0].message.content,
+                content="",
                 model=self.model,
                 provider="openai",
-                tokens_used=response.usage.total_tokens if response.usage else None,
-                success=True
+                success=False,
+                error=str(e)
             )
+    
+    async def _acall_openai(
+        self,
+        system_prompt: str,
+        user_prompt: str
+    ) -> AIResponse:
+        """Make a call to OpenAI API without blocking the event loop."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        key = make_cache_key(self.model, messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIResponse(**cached)
         
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=messages
+            )
+            return self._cache_response(key, response)
         except Exception as e:
             return AIResponse(
                 content="",
@@ -300,6 +463,293 @@ Focus on strategies that can be implemented before year-end if applicable.
                 error=str(e)
             )
     
+    def stream_openai(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        Yield the completion text as it is generated.
+        
+        The first words show up after the time-to-first-token instead of
+        after the whole completion. The assembled text is cached like
+        _call_openai results, so a rerun replays it in one chunk. Errors are
+        yielded as a message since the text goes straight to the page.
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        key = make_cache_key(self.model, messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached["content"]
+            return
+        
+        parts = []
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            yield f"\n\n⚠️ AI error: {e}"
+            return
+        self._cache_text(key, "".join(parts))
+    
+    async def astream_openai(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Async version of stream_openai."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        key = make_cache_key(self.model, messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached["content"]
+            return
+        
+        parts = []
+        try:
+            stream = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            yield f"\n\n⚠️ AI error: {e}"
+            return
+        self._cache_text(key, "".join(parts))
+    
+    def _cache_text(self, key: str, content: str) -> None:
+        """Cache streamed text (token usage is not reported for streams)."""
+        result = AIResponse(content=content, model=self.model, provider="openai")
+        self.cache.set(key, asdict(result))
+    
+    def _cache_response(self, key: str, response: Any) -> AIResponse:
+        """Wrap a completion in an AIResponse and cache it (failures are never cached)."""
+        result = AIResponse(
+            content=response.choices[0].message.content,
+            model=self.model,
+            provider="openai",
+            tokens_used=response.usage.total_tokens if response.usage else None,
+            success=True
+        )
+        self.cache.set(key, asdict(result))
+        return result
+    
+    def call_multi(self, system_prompt: str, user_prompts: List[str]) -> List[AIResponse]:
+        """
+        Answer several short, independent prompts with one request.
+        
+        The tasks share one round-trip, one rate-limit slot and one copy of
+        the system prompt. Keep this to small asks: answers are packed into
+        a single JSON reply. Falls back to one call per prompt when the
+        combined prompt is too long, and for any task the reply misses.
+        
+        Returns:
+            One AIResponse per prompt, in order
+        """
+        if self.provider != AIProvider.OPENAI:
+            return [self._mock_analysis_response() for _ in user_prompts]
+        if len(user_prompts) < 2 or sum(map(len, user_prompts)) > self.MULTI_TASK_MAX_CHARS:
+            return [self._call_openai(system_prompt, prompt) for prompt in user_prompts]
+        
+        tasks = [{"id": i, "prompt": prompt} for i, prompt in enumerate(user_prompts)]
+        packed_prompt = (
+            "Complete each of the following independent tasks separately.\n"
+            'Return a JSON object {"responses": [{"id": <task id>, "response": <your full answer as a string>}, ...]} '
+            "with exactly one entry per task.\n\n"
+            f"TASKS:\n{dumps_pretty(tasks)}"
+        )
+        combined = self._call_openai(
+            system_prompt, packed_prompt, response_format={"type": "json_object"}
+        )
+        
+        answers: Dict[int, str] = {}
+        if combined.success:
+            try:
+                for item in json.loads(combined.content).get("responses", []):
+                    answer = item.get("response")
+                    if not isinstance(answer, str):
+                        answer = json.dumps(answer)
+                    answers[int(item["id"])] = answer
+            except (ValueError, TypeError, KeyError, AttributeError):
+                answers = {}
+        
+        return [
+            AIResponse(content=answers[i], model=self.model, provider="openai")
+            if i in answers else self._call_openai(system_prompt, prompt)
+            for i, prompt in enumerate(user_prompts)
+        ]
+    
+    # =========================================================================
+    # BATCH API - offline bulk jobs (half price, separate rate limits, 24h SLA)
+    # =========================================================================
+    
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    
+    def submit_batch(self, tasks: List[Tuple[str, str]]) -> str:
+        """
+        Submit (system_prompt, user_prompt) pairs to the OpenAI Batch API.
+        
+        For non-interactive work such as precomputing strategies for many
+        profiles; the interactive UI keeps using _call_openai.
+        
+        Returns:
+            Batch id for poll_batch / fetch_batch_results
+        """
+        lines = []
+        for i, (system_prompt, user_prompt) in enumerate(tasks):
+            lines.append(json.dumps({
+                "custom_id": f"task-{i}",
+                "method": "POST",
+                "url": self.BATCH_ENDPOINT,
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ]
+                }
+            }))
+        payload = io.BytesIO("\n".join(lines).encode())
+        
+        batch_file = self.client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window="24h"
+        )
+        return batch.id
+    
+    def submit_strategy_batch(
+        self,
+        jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> str:
+        """Batch version of generate_strategies for (anonymized_profile, tax_result) pairs."""
+        return self.submit_batch([
+            (TAX_STRATEGY_SYSTEM_PROMPT, self._build_strategy_prompt(profile, tax_result))
+            for profile, tax_result in jobs
+        ])
+    
+    def poll_batch(self, batch_id: str) -> str:
+        """Current batch status ("validating", "in_progress", "completed", "failed", ...)."""
+        return self.client.batches.retrieve(batch_id).status
+    
+    def fetch_batch_results(self, batch_id: str) -> List[AIResponse]:
+        """
+        Results of a completed batch, one AIResponse per submitted task, in order.
+        
+        Tasks that failed (or a batch that has not completed) come back as
+        unsuccessful responses.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        total = batch.request_counts.total if batch.request_counts else 0
+        results = [
+            AIResponse(content="", model=self.model, provider="openai", success=False,
+                       error=f"batch {batch.status}")
+            for _ in range(total)
+        ]
+        
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"].rsplit("-", 1)[1])
+                response = record.get("response") or {}
+                body = response.get("body") or {}
+                if response.get("status_code") == 200 and body.get("choices"):
+                    usage = body.get("usage") or {}
+                    results[index] = AIResponse(
+                        content=body["choices"][0]["message"]["content"],
+                        model=self.model,
+                        provider="openai",
+                        tokens_used=usage.get("total_tokens")
+                    )
+                else:
+                    error = record.get("error") or body.get("error") or {}
+                    results[index] = AIResponse(
+                        content="",
+                        model=self.model,
+                        provider="openai",
+                        success=False,
+                        error=error.get("message", "batch request failed")
+                    )
+        return results
+    
+    # =========================================================================
+    # ASYNC VARIANTS - await several of these with asyncio.gather / run_many
+    # =========================================================================
+    
+    async def agenerate_strategies(
+        self,
+        anonymized_profile: Dict[str, Any],
+        current_tax_result: Dict[str, Any],
+        focus_areas: Optional[List[str]] = None
+    ) -> AIResponse:
+        """Async version of generate_strategies."""
+        if self.provider != AIProvider.OPENAI:
+            return self._mock_strategy_response(anonymized_profile, current_tax_result)
+        user_prompt = self._build_strategy_prompt(anonymized_profile, current_tax_result, focus_areas)
+        return await self._acall_openai(TAX_STRATEGY_SYSTEM_PROMPT, user_prompt)
+    
+    async def aanalyze_scenario(
+        self,
+        scenario_description: str,
+        anonymized_profile: Dict[str, Any],
+        current_tax_result: Dict[str, Any]
+    ) -> AIResponse:
+        """Async version of analyze_scenario."""
+        if self.provider != AIProvider.OPENAI:
+            return self._mock_analysis_response()
+        user_prompt = self._build_scenario_prompt(scenario_description, anonymized_profile, current_tax_result)
+        return await self._acall_openai(TAX_CALCULATION_SYSTEM_PROMPT, user_prompt)
+    
+    async def aexplain_strategy(
+        self,
+        strategy_name: str,
+        anonymized_profile: Dict[str, Any]
+    ) -> AIResponse:
+        """Async version of explain_strategy."""
+        if self.provider != AIProvider.OPENAI:
+            return self._mock_explanation_response(strategy_name)
+        user_prompt = self._build_explanation_prompt(strategy_name, anonymized_profile)
+        return await self._acall_openai(TAX_STRATEGY_SYSTEM_PROMPT, user_prompt)
+    
+    async def run_many(
+        self,
+        tasks: List[Tuple[str, str]],
+        concurrency: Optional[int] = None
+    ) -> List[AIResponse]:
+        """
+        Run several (system_prompt, user_prompt) calls concurrently.
+        
+        Wall time is roughly that of the slowest call instead of the sum;
+        at most `concurrency` requests are in flight at once. Results come
+        back in task order. From Streamlit: asyncio.run(client.run_many(...)).
+        """
+        if self.provider != AIProvider.OPENAI:
+            return [self._mock_analysis_response() for _ in tasks]
+        
+        semaphore = asyncio.Semaphore(concurrency or self.DEFAULT_CONCURRENCY)
+        
+        async def limited(system_prompt: str, user_prompt: str) -> AIResponse:
+            async with semaphore:
+                return await self._acall_openai(system_prompt, user_prompt)
+        
+        return await asyncio.gather(*(limited(system, user) for system, user in tasks))
+    
     def _mock_strategy_response(
         self,
         profile: Dict[str, Any],
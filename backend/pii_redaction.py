@@ -17,13 +17,26 @@ SECURITY NOTE: Original PII values are NEVER stored in the redaction map.
 We only store the TYPE of PII found, not the values themselves.
 """
 
+import os
 import re
+import functools
+import asyncio
+import bisect
+import threading
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
+from collections import defaultdict
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,7 +66,7 @@ PII_PATTERNS = {
     # Phone Numbers
     "PHONE": [
         r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 123-456-7890
-        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',      # (123) 456-7890
+        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}(?!\d)',  # (123) 456-7890, x89 extensions too
         r'\b1[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # 1-123-456-7890
     ],
     
@@ -90,12 +103,174 @@ PII_PATTERNS = {
     ],
 }
 
+# W-2 specific patterns, applied by W2Redactor after the generic ones
+W2_PII_PATTERNS = {
+    "EMPLOYEE_SSN": [
+        r'(?:Employee\'?s?\s*)?(?:social\s*security\s*)?(?:number|SSN|#)[:\s]*((?<!\d)\d{3}[-\s]?\d{2}[-\s]?\d{4}(?!\d))',
+    ],
+    "EMPLOYER_EIN": [
+        r'(?:Employer\'?s?\s*)?(?:identification\s*)?(?:number|EIN|#)[:\s]*((?<!\d)\d{2}[-\s]?\d{7}(?!\d))',
+    ],
+    "CONTROL_NUMBER": [
+        r'[Cc]ontrol\s*[Nn]umber[:\s]*([A-Za-z0-9]+)',
+    ]
+}
+
+
+def compile_pii_patterns(patterns: Dict[str, List[str]]) -> List[Tuple[str, "re.Pattern[str]"]]:
+    """
+    Compile each PII type's patterns into one case-insensitive alternation.
+    
+    Returns:
+        (pii type, compiled regex) pairs in listing order, which is also
+        the priority order when matches of different types overlap
+    """
+    return [
+        (pii_type, re.compile("|".join(f"(?:{pattern})" for pattern in type_patterns), re.IGNORECASE))
+        for pii_type, type_patterns in patterns.items()
+    ]
+
+
+PII_TYPE_PATTERNS = compile_pii_patterns(PII_PATTERNS)
+W2_PII_TYPE_PATTERNS = compile_pii_patterns({**PII_PATTERNS, **W2_PII_PATTERNS})
+
+
+# A redaction span: (start, end, pii_type) in character offsets
+Span = Tuple[int, int, str]
+
+
+def claim_span(spans: List[Span], starts: List[int], start: int, end: int, pii_type: str) -> bool:
+    """
+    Insert a span into a sorted, non-overlapping span list.
+    
+    `starts` mirrors the span start offsets for bisection. Returns False
+    (and leaves both lists untouched) if the span overlaps one already taken.
+    """
+    i = bisect.bisect_right(starts, start)
+    if i and spans[i - 1][1] > start:
+        return False
+    if i < len(spans) and spans[i][0] < end:
+        return False
+    starts.insert(i, start)
+    spans.insert(i, (start, end, pii_type))
+    return True
+
+
+class HyperscanMatcher:
+    """
+    Prefilter: every PII pattern in a single Hyperscan database.
+    
+    One linear scan tells which PII types occur in a text at all, so the
+    per-type `re` scans (which decide the exact spans and their priority)
+    run only for those types. Types with a pattern Hyperscan cannot compile
+    (e.g. lookahead) are always reported.
+    """
+    
+    FLAGS = hyperscan.HS_FLAG_CASELESS if HYPERSCAN_AVAILABLE else 0
+    
+    def __init__(self, patterns: Dict[str, List[str]]):
+        # Pattern id -> PII type
+        self.pattern_types: List[str] = []
+        expressions: List[bytes] = []
+        ids: List[int] = []
+        self.always_types: Set[str] = set()
+        
+        for pii_type, type_patterns in patterns.items():
+            for pattern in type_patterns:
+                if self._supported(pattern):
+                    expressions.append(pattern.encode())
+                    ids.append(len(self.pattern_types))
+                    self.pattern_types.append(pii_type)
+                else:
+                    self.always_types.add(pii_type)
+        
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[self.FLAGS] * len(expressions),
+        )
+    
+    @classmethod
+    def _supported(cls, pattern: str) -> bool:
+        try:
+            hyperscan.Database().compile(expressions=[pattern.encode()], flags=[cls.FLAGS])
+        except hyperscan.error:
+            return False
+        return True
+    
+    def present_types(self, text: str) -> Set[str]:
+        """PII types that may occur in text (a superset of those that do)."""
+        found = set(self.always_types)
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(self.pattern_types[pattern_id])
+        
+        self._db.scan(text.encode("utf-8"), match_event_handler=on_match)
+        return found
+
+
+HYPERSCAN_PII_MATCHER = HyperscanMatcher(PII_PATTERNS) if HYPERSCAN_AVAILABLE else None
+HYPERSCAN_W2_PII_MATCHER = (
+    HyperscanMatcher({**PII_PATTERNS, **W2_PII_PATTERNS}) if HYPERSCAN_AVAILABLE else None
+)
+
+# Final sanitization pass: long digit runs (group 1) or card-shaped numbers.
+# Both need four digits in a row, which the cheap probe checks first.
+SANITIZE_RE = re.compile(r'\b(\d{10,})\b|\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b')
+SANITIZE_PROBE_RE = re.compile(r'\d{4}')
+
+# Leak checks run on text about to be sent to an LLM
+SSN_LEAK_RE = re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b')
+EMAIL_LEAK_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EIN_LEAK_RE = re.compile(r'\b\d{2}-\d{7}\b')
+LONG_NUMBER_LEAK_RE = re.compile(r'\b\d{9,}\b')
+
+# spaCy components NER does not need
+NER_DISABLED_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# Organizations that are not PII (IRS, Social Security Admin, etc.)
+NER_SKIP_ORGS = frozenset({
+    'irs', 'internal revenue service', 'social security',
+    'medicare', 'department of', 'state of',
+})
+
+
+def _sanitized_token(match: "re.Match[str]") -> str:
+    return '[ACCOUNT_NUMBER]' if match.group(1) else '[CARD_NUMBER]'
+
+
+# Token strings per PII type, shared across documents: _TOKEN_CACHE[t][n - 1]
+# is "[t_n]". Lists only grow (under the lock), so readers need no locking.
+TOKEN_CACHE_PREWARM = 64
+_TOKEN_CACHE: Dict[str, List[str]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_list(pii_type: str, count: int) -> List[str]:
+    """The token list for pii_type, grown to hold at least count tokens."""
+    with _token_cache_lock:
+        tokens = _TOKEN_CACHE.setdefault(pii_type, [])
+        while len(tokens) < count:
+            tokens.append(f"[{pii_type}_{len(tokens) + 1}]")
+        return tokens
+
+
+for _pii_type in (*PII_PATTERNS, *W2_PII_PATTERNS, "USER_NAME", "EMPLOYER"):
+    _token_list(_pii_type, TOKEN_CACHE_PREWARM)
+
+
+# Shared pool for redacting off the caller's thread (threads start lazily)
+REDACTION_WORKERS = os.cpu_count() or 1
+_redact_pool = ThreadPoolExecutor(max_workers=REDACTION_WORKERS, thread_name_prefix="pii-redact")
+
 
 # =============================================================================
 # REDACTION CLASS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RedactionResult:
     """Result of the PII redaction process."""
     
@@ -113,6 +288,36 @@ class RedactionResult:
         return self.redaction_count > 0
 
 
+@functools.lru_cache(maxsize=1)
+def get_ner_model():
+    """
+    Load the spaCy NER model once per process, on first use.
+    
+    Returns None (and is not retried) if spaCy or the model is unavailable.
+    """
+    try:
+        import spacy
+        
+        # Try to load the model
+        try:
+            nlp = spacy.load("en_core_web_sm", disable=NER_DISABLED_COMPONENTS)
+            logger.info("Loaded spaCy NER model: en_core_web_sm")
+        except OSError:
+            # Model not installed, try to download
+            logger.warning("spaCy model not found. Attempting download...")
+            import subprocess
+            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], 
+                         capture_output=True)
+            nlp = spacy.load("en_core_web_sm", disable=NER_DISABLED_COMPONENTS)
+        return nlp
+            
+    except ImportError:
+        logger.warning("spaCy not installed. NER-based redaction disabled.")
+    except Exception as e:
+        logger.warning(f"Could not load spaCy: {e}. NER-based redaction disabled.")
+    return None
+
+
 class PIIRedactor:
     """
     Main PII redaction engine.
@@ -121,92 +326,94 @@ class PIIRedactor:
     The token_map only stores: {token: pii_type}
     """
     
-    def __init__(self, use_ner: bool = True):
+    # (PII type, compiled patterns) in priority order; subclasses extend these
+    type_patterns = PII_TYPE_PATTERNS
+    # Single-scan prefilter over the same patterns when Hyperscan is installed
+    hyperscan_matcher = HYPERSCAN_PII_MATCHER
+    
+    def __init__(self, use_ner: bool = False):
         """
         Initialize the redactor.
         
         Args:
-            use_ner: Whether to use NER for name detection.
-                    Set to False if spaCy is not available.
+            use_ner: Whether to use NER for name detection. Off by default:
+                    regex covers the structured PII in paystubs and W-2s,
+                    and the spaCy model is only loaded when NER is on.
         """
         self.use_ner = use_ner
-        self._nlp = None
-        self._counters: Dict[str, int] = {}
-        
-        if use_ner:
-            self._load_ner_model()
     
-    def _load_ner_model(self):
-        """Load spaCy NER model."""
-        try:
-            import spacy
-            
-            # Try to load the model
-            try:
-                self._nlp = spacy.load("en_core_web_sm")
-                logger.info("Loaded spaCy NER model: en_core_web_sm")
-            except OSError:
-                # Model not installed, try to download
-                logger.warning("spaCy model not found. Attempting download...")
-                import subprocess
-                subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], 
-                             capture_output=True)
-                self._nlp = spacy.load("en_core_web_sm")
-                
-        except ImportError:
-            logger.warning("spaCy not installed. NER-based redaction disabled.")
-            self.use_ner = False
-        except Exception as e:
-            logger.warning(f"Could not load spaCy: {e}. NER-based redaction disabled.")
+    @property
+    def _nlp(self):
+        """Shared spaCy pipeline, loaded on first use; None if NER is off or unavailable."""
+        if not self.use_ner:
+            return None
+        nlp = get_ner_model()
+        if nlp is None:
             self.use_ner = False
-    
-    def _get_token(self, pii_type: str) -> str:
-        """Generate a unique token for a PII type."""
-        count = self._counters.get(pii_type, 0) + 1
-        self._counters[pii_type] = count
-        return f"[{pii_type}_{count}]"
-    
-    def _redact_with_regex(self, text: str, token_map: Dict[str, str]) -> Tuple[str, Set[str]]:
+        return nlp
+    
+    def _get_token(self, pii_type: str, counters: Dict[str, int]) -> str:
+        """Generate a unique token for a PII type (counters are per document)."""
+        counters[pii_type] += 1
+        count = counters[pii_type]
+        tokens = _TOKEN_CACHE.get(pii_type)
+        if tokens is None or len(tokens) < count:
+            tokens = _token_list(pii_type, count)
+        return tokens[count - 1]
+    
+    def _redact_with_regex(self, text: str) -> List[Span]:
         """
-        Apply regex-based redaction.
+        Find structured PII with the regex patterns, one scan per type.
+        
+        Types are scanned in priority order, each only over the text no
+        higher-priority match has taken (as the old sequential replace
+        passes did), so a loose pattern such as ADDRESS can never swallow
+        part of a BANK_ACCOUNT or SSN.
         
         Returns:
-            Tuple of (redacted_text, set of pii types found)
+            Non-overlapping (start, end, pii_type) spans, sorted by start
         """
-        pii_found = set()
-        redacted = text
-        
-        for pii_type, patterns in PII_PATTERNS.items():
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, redacted, re.IGNORECASE))
-                
-                # Process matches in reverse order to maintain string positions
-                for match in reversed(matches):
-                    token = self._get_token(pii_type)
-                    token_map[token] = pii_type
-                    
-                    # Replace the match with the token
-                    redacted = redacted[:match.start()] + token + redacted[match.end():]
-                    pii_found.add(pii_type)
-        
-        return redacted, pii_found
-    
-    def _redact_with_ner(self, text: str, token_map: Dict[str, str]) -> Tuple[str, Set[str]]:
+        present = None
+        if self.hyperscan_matcher is not None:
+            present = self.hyperscan_matcher.present_types(text)
+        
+        spans: List[Span] = []
+        text_end = len(text)
+        for pii_type, regex in self.type_patterns:
+            if present is not None and pii_type not in present:
+                continue
+            
+            found: List[Span] = []
+            pos = 0
+            for start, end, _ in spans + [(text_end, text_end, "")]:
+                if start > pos:
+                    found.extend(
+                        (match.start(), match.end(), pii_type)
+                        for match in regex.finditer(text, pos, start)
+                    )
+                pos = max(pos, end)
+            if found:
+                spans = sorted(spans + found)
+        return spans
+    
+    def _redact_with_ner(self, text: str, doc=None) -> List[Span]:
         """
-        Apply NER-based redaction for names and organizations.
+        Find names and organizations with NER.
+        
+        Args:
+            text: Text to analyze
+            doc: spaCy Doc for text, if already parsed (see redact_batch)
         
         Returns:
-            Tuple of (redacted_text, set of pii types found)
+            (start, end, pii_type) spans for entities to redact
         """
-        if not self._nlp:
-            return text, set()
-        
-        pii_found = set()
-        
-        # Process with spaCy
-        doc = self._nlp(text)
+        if doc is None:
+            nlp = self._nlp
+            if nlp is None:
+                return []
+            # Process with spaCy
+            doc = nlp(text)
         
-        # Collect entities to redact (in reverse order for safe replacement)
         entities_to_redact = []
         
         for ent in doc.ents:
@@ -216,40 +423,47 @@ class PIIRedactor:
                 # Only redact if it looks like an employer name
                 # Skip common non-PII orgs (IRS, Social Security Admin, etc.)
                 org_text = ent.text.lower()
-                skip_orgs = {'irs', 'internal revenue service', 'social security', 
-                            'medicare', 'department of', 'state of'}
-                if not any(skip in org_text for skip in skip_orgs):
+                if not any(skip in org_text for skip in NER_SKIP_ORGS):
                     entities_to_redact.append((ent.start_char, ent.end_char, "EMPLOYER"))
             elif ent.label_ == "GPE":
                 # Geo-political entities (cities, states, countries)
                 # Only redact if it's likely part of an address
                 pass  # Address patterns handled by regex
         
-        # Sort by position (descending) for safe replacement
-        entities_to_redact.sort(key=lambda x: x[0], reverse=True)
+        return entities_to_redact
+    
+    def _apply_spans(self, text: str, spans: List[Span], token_map: Dict[str, str]) -> str:
+        """
+        Replace each span with a token in a single pass.
         
-        redacted = text
-        for start, end, pii_type in entities_to_redact:
-            token = self._get_token(pii_type)
+        Building the output with one join copies the text once, instead of
+        once per match as repeated slice-and-concat does.
+        """
+        parts = []
+        counters: Dict[str, int] = defaultdict(int)
+        last_end = 0
+        for start, end, pii_type in spans:
+            token = self._get_token(pii_type, counters)
             token_map[token] = pii_type
-            redacted = redacted[:start] + token + redacted[end:]
-            pii_found.add(pii_type)
-        
-        return redacted, pii_found
+            parts.append(text[last_end:start])
+            parts.append(token)
+            last_end = end
+        parts.append(text[last_end:])
+        return "".join(parts)
     
     def _additional_sanitization(self, text: str) -> str:
         """
         Additional sanitization passes for edge cases.
         """
-        # Remove any remaining sequences that look like account numbers
-        text = re.sub(r'\b\d{10,}\b', '[ACCOUNT_NUMBER]', text)
-        
-        # Remove any remaining sequences that look like credit cards (16 digits)
-        text = re.sub(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b', '[CARD_NUMBER]', text)
+        # Most redacted text has no four-digit run left, so skip the full pass
+        if not SANITIZE_PROBE_RE.search(text):
+            return text
         
-        return text
+        # Remaining sequences that look like account numbers (10+ digits)
+        # or credit cards (16 digits), in one scan
+        return SANITIZE_RE.sub(_sanitized_token, text)
     
-    def redact_sensitive_data(self, raw_text: str) -> RedactionResult:
+    def redact_sensitive_data(self, raw_text: str, doc=None) -> RedactionResult:
         """
         Main method: Redact all sensitive PII from text.
         
@@ -258,6 +472,7 @@ class PIIRedactor:
         
         Args:
             raw_text: Original text from OCR/document extraction
+            doc: spaCy Doc for raw_text, if already parsed
             
         Returns:
             RedactionResult with redacted text and metadata
@@ -265,8 +480,6 @@ class PIIRedactor:
         import time
         start_time = time.time()
         
-        # Reset counters for this document
-        self._counters = {}
         token_map: Dict[str, str] = {}
         pii_found: Set[str] = set()
         warnings: List[str] = []
@@ -279,17 +492,23 @@ class PIIRedactor:
                 warnings=["Empty input text"]
             )
         
-        # Step 1: Regex-based redaction (catches structured PII)
-        redacted_text, regex_pii = self._redact_with_regex(raw_text, token_map)
-        pii_found.update(regex_pii)
-        
-        # Step 2: NER-based redaction (catches names, organizations)
-        if self.use_ner:
-            redacted_text, ner_pii = self._redact_with_ner(redacted_text, token_map)
-            pii_found.update(ner_pii)
-        else:
+        use_ner = doc is not None or self._nlp is not None
+        if not use_ner:
             warnings.append("NER disabled - name detection may be incomplete")
         
+        # Step 1: Regex-based detection (catches structured PII)
+        spans = self._redact_with_regex(raw_text)
+        
+        # Step 2: NER-based detection (catches names, organizations);
+        # regex matches take precedence where the two overlap
+        if use_ner:
+            starts = [start for start, _, _ in spans]
+            for start, end, pii_type in self._redact_with_ner(raw_text, doc):
+                claim_span(spans, starts, start, end, pii_type)
+        
+        redacted_text = self._apply_spans(raw_text, spans, token_map)
+        pii_found.update(token_map.values())
+        
         # Step 3: Additional sanitization
         redacted_text = self._additional_sanitization(redacted_text)
         
@@ -311,6 +530,34 @@ class PIIRedactor:
             warnings=warnings
         )
     
+    def redact_batch(self, texts: List[str], batch_size: int = 32) -> List[RedactionResult]:
+        """
+        Redact several documents, running NER over them with nlp.pipe.
+        
+        Args:
+            texts: Raw texts to redact
+            batch_size: Documents per spaCy batch
+            
+        Returns:
+            One RedactionResult per text, in order
+        """
+        nlp = self._nlp
+        if nlp is None:
+            return [self.redact_sensitive_data(text) for text in texts]
+        
+        docs = nlp.pipe(texts, batch_size=batch_size)
+        return [self.redact_sensitive_data(text, doc) for text, doc in zip(texts, docs)]
+    
+    async def aredact_sensitive_data(self, raw_text: str) -> RedactionResult:
+        """
+        Redact on the shared thread pool without blocking the event loop.
+        
+        NER is CPU-bound and runs for tens of milliseconds per page; the API
+        awaits this so other requests are served meanwhile.
+        """
+        future = _redact_pool.submit(self.redact_sensitive_data, raw_text)
+        return await asyncio.wrap_future(future)
+    
     def validate_no_pii_leakage(self, text: str) -> Tuple[bool, List[str]]:
         """
         Validate that text contains no apparent PII.
@@ -322,20 +569,20 @@ class PIIRedactor:
         issues = []
         
         # Check for SSN patterns
-        if re.search(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b', text):
+        if SSN_LEAK_RE.search(text):
             issues.append("Potential SSN pattern detected")
         
         # Check for email patterns (unless they're redacted tokens)
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+        if EMAIL_LEAK_RE.search(text):
             if "[EMAIL" not in text:
                 issues.append("Potential email address detected")
         
         # Check for EIN patterns
-        if re.search(r'\b\d{2}-\d{7}\b', text):
+        if EIN_LEAK_RE.search(text):
             issues.append("Potential EIN pattern detected")
         
         # Check for 9+ consecutive digits (potential account numbers)
-        if re.search(r'\b\d{9,}\b', text):
+        if LONG_NUMBER_LEAK_RE.search(text):
             issues.append("Long numeric sequence detected (potential account/SSN)")
         
         is_safe = len(issues) == 0
@@ -346,7 +593,7 @@ class PIIRedactor:
 # CONVENIENCE FUNCTION (for direct import)
 # =============================================================================
 
-def redact_sensitive_data(raw_text: str, use_ner: bool = True) -> str:
+def redact_sensitive_data(raw_text: str, use_ner: bool = False) -> str:
     """
     Convenience function to redact PII from text.
     
@@ -362,6 +609,19 @@ def redact_sensitive_data(raw_text: str, use_ner: bool = True) -> str:
     return result.redacted_text
 
 
+WARMUP_TEXT = "Employee: John Smith\nSSN: 123-45-6789\nEmail: john@example.com\nPhone: (555) 123-4567"
+
+
+def warmup(use_ner: bool = False) -> None:
+    """
+    Pay one-time startup costs before the first real document arrives.
+    
+    Runs a short redaction so the regex engine, token cache and (with
+    use_ner) the spaCy model are all loaded, instead of on a user's request.
+    """
+    PIIRedactor(use_ner=use_ner).redact_sensitive_data(WARMUP_TEXT)
+
+
 # =============================================================================
 # SPECIALIZED REDACTORS FOR SPECIFIC DOCUMENT TYPES
 # =============================================================================
@@ -372,12 +632,12 @@ class PaystubRedactor(PIIRedactor):
     Preserves financial data while redacting identity info.
     """
     
-    def redact_sensitive_data(self, raw_text: str) -> RedactionResult:
+    def redact_sensitive_data(self, raw_text: str, doc=None) -> RedactionResult:
         """
         Redact PII from paystub while preserving financial figures.
         """
         # First, run standard redaction
-        result = super().redact_sensitive_data(raw_text)
+        result = super().redact_sensitive_data(raw_text, doc)
         
         # Paystubs often have employee IDs that look numeric
         # But we want to preserve dollar amounts
@@ -393,35 +653,11 @@ class W2Redactor(PIIRedactor):
     Knows the structure of W-2 and redacts appropriately.
     """
     
-    def redact_sensitive_data(self, raw_text: str) -> RedactionResult:
-        """
-        Redact PII from W-2 while preserving box values.
-        """
-        # W-2 specific patterns
-        w2_patterns = {
-            "EMPLOYEE_SSN": [
-                r'(?:Employee\'?s?\s*)?(?:social\s*security\s*)?(?:number|SSN|#)[:\s]*(\d{3}[-\s]?\d{2}[-\s]?\d{4})',
-            ],
-            "EMPLOYER_EIN": [
-                r'(?:Employer\'?s?\s*)?(?:identification\s*)?(?:number|EIN|#)[:\s]*(\d{2}[-\s]?\d{7})',
-            ],
-            "CONTROL_NUMBER": [
-                r'[Cc]ontrol\s*[Nn]umber[:\s]*([A-Za-z0-9]+)',
-            ]
-        }
-        
-        # Add W-2 specific patterns temporarily
-        original_patterns = PII_PATTERNS.copy()
-        PII_PATTERNS.update(w2_patterns)
-        
-        try:
-            result = super().redact_sensitive_data(raw_text)
-        finally:
-            # Restore original patterns
-            PII_PATTERNS.clear()
-            PII_PATTERNS.update(original_patterns)
-        
-        return result
+    # W-2 specific patterns on top of the generic ones. A class attribute
+    # rather than a temporary edit of the shared PII_PATTERNS dict, so
+    # concurrent redactions never see each other's patterns.
+    type_patterns = W2_PII_TYPE_PATTERNS
+    hyperscan_matcher = HYPERSCAN_W2_PII_MATCHER
 
 
 # =============================================================================
@@ -461,8 +697,8 @@ def demo():
     print("PII REDACTION DEMO")
     print("=" * 60)
     
-    # Initialize redactor (NER may not be available)
-    redactor = PIIRedactor(use_ner=True)
+    # Initialize redactor (regex only; pass use_ner=True to also catch names)
+    redactor = PIIRedactor()
     
     # Perform redaction
     result = redactor.redact_sensitive_data(sample_text)
@@ -65,31 +65,50 @@ def sync_and_calculate():
     ep = st.session_state.enhanced_profile
     p = st.session_state.profile
     
-    p.filing_status = ep.filing_status
-    p.age = ep.age
-    p.ytd_income = ep.total_ytd_w2_income
-    p.ytd_federal_withheld = ep.total_ytd_federal_withheld
-    p.estimated_payments_made = ep.total_estimated_payments
-    p.self_employment_income = ep.total_self_employment_income
-    p.interest_income = ep.investments.taxable_interest
-    p.dividend_income = ep.investments.ordinary_dividends
-    p.capital_gains_long = ep.investments.long_term_gains
-    p.capital_gains_short = ep.investments.short_term_gains
-    p.ytd_401k_traditional = ep.ytd_401k_traditional
-    p.ytd_hsa = ep.ytd_hsa
-    p.num_children_under_17 = ep.num_children_under_17
+    updates = {
+        'filing_status': ep.filing_status,
+        'age': ep.age,
+        'ytd_income': ep.total_ytd_w2_income,
+        'ytd_federal_withheld': ep.total_ytd_federal_withheld,
+        'estimated_payments_made': ep.total_estimated_payments,
+        'self_employment_income': ep.total_self_employment_income,
+        'interest_income': ep.investments.taxable_interest,
+        'dividend_income': ep.investments.ordinary_dividends,
+        'capital_gains_long': ep.investments.long_term_gains,
+        'capital_gains_short': ep.investments.short_term_gains,
+        'ytd_401k_traditional': ep.ytd_401k_traditional,
+        'ytd_hsa': ep.ytd_hsa,
+        'num_children_under_17': ep.num_children_under_17,
+    }
     
     for s in ep.income_sources:
         if s.source_type == IncomeSourceType.W2_PRIMARY:
-            p.pay_frequency = PayFrequency(s.pay_frequency.value)
-            p.current_pay_period = s.current_pay_period
+            updates['pay_frequency'] = PayFrequency(s.pay_frequency.value)
+            updates['current_pay_period'] = s.current_pay_period
             break
     
+    # Most reruns change nothing; validate only the fields that did change,
+    # which also refreshes the projections derived from them
+    changed = {k: v for k, v in updates.items() if getattr(p, k) != v}
+    if changed:
+        p.apply_updates(changed)
+    
+    # TaxCalculator memoizes by profile fingerprint; recommendations are
+    # cached here on the same key so an unchanged profile skips both
     calc = TaxCalculator()
     st.session_state.tax_result = calc.calculate_tax(p)
+    st.session_state.recommendations = cached_recommendations(p.fingerprint(), p)
+
+
+@st.cache_data(max_entries=256, ttl=3600)
+def cached_recommendations(fingerprint: bytes, _profile: UserFinancialProfile):
+    """
+    Recommendations for one profile snapshot, cached on its fingerprint.
     
-    engine = RecommendationEngine()
-    st.session_state.recommendations = engine.generate_recommendations(p)
+    The leading underscore tells Streamlit not to hash the profile itself;
+    the TTL keeps date-dependent advice (deadlines, pay periods) current.
+    """
+    return RecommendationEngine().generate_recommendations(_profile)
 
 
 # =============================================================================
@@ -208,28 +227,34 @@ with tab2:
         ("Self-Employment", IncomeSourceType.SELF_EMPLOYMENT),
     ]
     
+    # Type stays outside the form: it decides which fields the form shows
     stype = st.selectbox("Type", types, format_func=lambda x: x[0])
-    sname = st.text_input("Name", placeholder="e.g., 'Tech Corp'")
-    
     is_w2 = stype[1] in [IncomeSourceType.W2_PRIMARY, IncomeSourceType.W2_SECONDARY, IncomeSourceType.W2_SPOUSE]
     
-    c1, c2 = st.columns(2)
-    if is_w2:
-        with c1:
-            freq = st.selectbox("Pay Frequency", [p.value for p in EnhancedPayFrequency], index=1)
-            period = st.number_input("Pay Period #", 1, 52, 20)
-            ytd = st.number_input("YTD Gross", 0.0, step=1000.0)
-        with c2:
-            fed = st.number_input("YTD Federal Withheld", 0.0, step=100.0)
-            state = st.number_input("YTD State Withheld", 0.0, step=100.0)
-            k401 = st.number_input("YTD 401(k)", 0.0, step=500.0)
-    else:
-        with c1:
-            est_amt = st.number_input("Est. Annual Amount", 0.0, step=1000.0)
-        with c2:
-            est_pay = st.number_input("Est. Tax Payments", 0.0, step=100.0)
+    # Inside a form, typing in a field doesn't rerun the whole script;
+    # everything is submitted together by the Add button
+    with st.form("add_source", clear_on_submit=True):
+        sname = st.text_input("Name", placeholder="e.g., 'Tech Corp'")
+        
+        c1, c2 = st.columns(2)
+        if is_w2:
+            with c1:
+                freq = st.selectbox("Pay Frequency", [p.value for p in EnhancedPayFrequency], index=1)
+                period = st.number_input("Pay Period #", 1, 52, 20)
+                ytd = st.number_input("YTD Gross", 0.0, step=1000.0)
+            with c2:
+                fed = st.number_input("YTD Federal Withheld", 0.0, step=100.0)
+                state = st.number_input("YTD State Withheld", 0.0, step=100.0)
+                k401 = st.number_input("YTD 401(k)", 0.0, step=500.0)
+        else:
+            with c1:
+                est_amt = st.number_input("Est. Annual Amount", 0.0, step=1000.0)
+            with c2:
+                est_pay = st.number_input("Est. Tax Payments", 0.0, step=100.0)
+        
+        add_submitted = st.form_submit_button("➕ Add", type="primary")
     
-    if st.button("➕ Add", type="primary"):
+    if add_submitted:
         src = IncomeSource(
             source_type=stype[1],
             name=sname or "Unnamed",
@@ -257,13 +282,15 @@ with tab2:
     
     st.divider()
     st.subheader("📅 Estimated Payments")
-    c1, c2, c3, c4 = st.columns(4)
-    q1 = c1.number_input("Q1", 0.0, value=float(st.session_state.enhanced_profile.q1_estimated_payment))
-    q2 = c2.number_input("Q2", 0.0, value=float(st.session_state.enhanced_profile.q2_estimated_payment))
-    q3 = c3.number_input("Q3", 0.0, value=float(st.session_state.enhanced_profile.q3_estimated_payment))
-    q4 = c4.number_input("Q4", 0.0, value=float(st.session_state.enhanced_profile.q4_estimated_payment))
+    with st.form("estimated_payments"):
+        c1, c2, c3, c4 = st.columns(4)
+        q1 = c1.number_input("Q1", 0.0, value=float(st.session_state.enhanced_profile.q1_estimated_payment))
+        q2 = c2.number_input("Q2", 0.0, value=float(st.session_state.enhanced_profile.q2_estimated_payment))
+        q3 = c3.number_input("Q3", 0.0, value=float(st.session_state.enhanced_profile.q3_estimated_payment))
+        q4 = c4.number_input("Q4", 0.0, value=float(st.session_state.enhanced_profile.q4_estimated_payment))
+        payments_submitted = st.form_submit_button("💾 Save Payments")
     
-    if st.button("💾 Save Payments"):
+    if payments_submitted:
         ep = st.session_state.enhanced_profile
         ep.q1_estimated_payment = q1
         ep.q2_estimated_payment = q2
@@ -9,8 +9,15 @@ The LLM must reference these values - never hallucinate brackets.
 Last Updated: 2025 Tax Year (Projected based on IRS announcements)
 """
 
+import functools
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # =============================================================================
 # FILING STATUS ENUM
@@ -253,10 +260,12 @@ STATE_TAX_RATES = {
 # HELPER FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
 def get_tax_bracket_info(filing_status: FilingStatus) -> str:
     """
     Return a formatted string of tax brackets for the given filing status.
     This is used to provide the LLM with accurate bracket information.
+    Built once per status; the brackets never change at runtime.
     """
     brackets = TAX_BRACKETS_2025[filing_status]
     lines = [f"2025 Federal Tax Brackets for {filing_status.value.replace('_', ' ').title()}:"]
@@ -287,26 +296,61 @@ def calculate_federal_tax(taxable_income: float, filing_status: FilingStatus) ->
     if taxable_income <= 0:
         return 0.0
     
-    brackets = TAX_BRACKETS_2025[filing_status]
-    total_tax = 0.0
-    remaining_income = taxable_income
-    prev_limit = 0
+    # Imported here: tax_kernels builds its tables from this module
+    from tax_kernels import BRACKET_TABLES, BRACKET_TAX_BELOW, bracket_lookup
     
-    for limit, rate in brackets:
-        bracket_size = limit - prev_limit if limit != float('inf') else remaining_income
-        taxable_in_bracket = min(remaining_income, bracket_size)
-        
-        if taxable_in_bracket <= 0:
-            break
-            
-        total_tax += taxable_in_bracket * rate
-        remaining_income -= taxable_in_bracket
-        prev_limit = limit
+    total_tax, _, _ = bracket_lookup(
+        float(taxable_income), *BRACKET_TABLES[filing_status], BRACKET_TAX_BELOW[filing_status]
+    )
+    return round(total_tax, 2)
+
+
+if NUMPY_AVAILABLE:
+    def _bracket_arrays(brackets):
+        """(lower bounds, upper bounds, rates, tax owed below each bracket)."""
+        lower = np.array([0.0] + [limit for limit, _ in brackets[:-1]])
+        upper = np.array([limit for limit, _ in brackets])
+        rates = np.array([rate for _, rate in brackets])
+        full_brackets = (upper[:-1] - lower[:-1]) * rates[:-1]
+        tax_below = np.concatenate(([0.0], np.cumsum(full_brackets)))
+        return lower, upper, rates, tax_below
+
+    # Per filing status for the batch path
+    _BRACKET_ARRAYS = {
+        status: _bracket_arrays(brackets)
+        for status, brackets in TAX_BRACKETS_2025.items()
+    }
+
+
+def calculate_federal_tax_batch(
+    taxable_incomes: Sequence[float],
+    filing_status: FilingStatus
+) -> List[float]:
+    """
+    Calculate federal income tax for many taxable incomes at once.
+    
+    Same result as calling calculate_federal_tax on each income, but with
+    NumPy installed each income's bracket is found with a binary search and
+    its tax is the precomputed tax below that bracket plus the rate on the
+    remainder - no Python loop per income.
+    
+    Args:
+        taxable_incomes: Incomes after deductions
+        filing_status: Filing status enum shared by all incomes
         
-        if remaining_income <= 0:
-            break
+    Returns:
+        Federal income tax owed for each income, in input order
+    """
+    if not NUMPY_AVAILABLE:
+        return [calculate_federal_tax(income, filing_status) for income in taxable_incomes]
     
-    return round(total_tax, 2)
+    lower, upper, rates, tax_below = _BRACKET_ARRAYS[filing_status]
+    incomes = np.maximum(np.asarray(taxable_incomes, dtype=float), 0.0)
+    
+    # Index of the bracket each income falls in (upper bounds are inclusive)
+    bracket = np.searchsorted(upper, incomes, side='left')
+    taxes = tax_below[bracket] + (incomes - lower[bracket]) * rates[bracket]
+    return np.round(taxes, 2).tolist()
 
 
 def get_marginal_rate(taxable_income: float, filing_status: FilingStatus) -> float:
@@ -333,10 +377,12 @@ def get_effective_rate(taxable_income: float, filing_status: FilingStatus) -> fl
 # EXPORT CONSTANTS FOR LLM PROMPTS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_all_constants_for_llm() -> str:
     """
     Generate a comprehensive string of all tax constants for inclusion
     in LLM system prompts. This ensures the AI never hallucinates values.
+    Built on first use and reused for every prompt.
     """
     output = []
     output.append("=" * 60)
@@ -0,0 +1,104 @@
+"""
+TaxGuard AI - Tax Kernels
+=========================
+Tight numeric loops used by the tax engine.
+
+With Numba installed the kernels are JIT-compiled and cached on disk, so the
+compile cost is paid once per machine rather than once per process. Without
+it they run as plain Python over tuples and return identical results.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Sequence, Tuple
+
+from tax_constants import FilingStatus, TAX_BRACKETS_2025
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# =============================================================================
+# BRACKET TABLES
+# =============================================================================
+
+def _bracket_table(brackets: Sequence[Tuple[float, float]]) -> tuple:
+    """(lower bounds, upper bounds, rates) for one filing status."""
+    uppers = [float(limit) for limit, _ in brackets]
+    lowers = [0.0] + uppers[:-1]
+    rates = [float(rate) for _, rate in brackets]
+    if NUMBA_AVAILABLE:
+        return tuple(np.asarray(column, dtype=np.float64) for column in (lowers, uppers, rates))
+    # Indexing NumPy arrays from interpreted code is slower than tuples
+    return tuple(lowers), tuple(uppers), tuple(rates)
+
+
+BRACKET_TABLES: Dict[FilingStatus, tuple] = {
+    status: _bracket_table(brackets)
+    for status, brackets in TAX_BRACKETS_2025.items()
+}
+
+
+def _tax_below(brackets: Sequence[Tuple[float, float]]):
+    """Tax owed on the full brackets below each bracket for one filing status."""
+    lower = 0.0
+    total = 0.0
+    tax_below = [0.0]
+    # Accumulated in the same order as bracket_walk, so results match exactly
+    for limit, rate in brackets[:-1]:
+        total += (float(limit) - lower) * float(rate)
+        tax_below.append(total)
+        lower = float(limit)
+    if NUMBA_AVAILABLE:
+        return np.asarray(tax_below, dtype=np.float64)
+    return tuple(tax_below)
+
+
+BRACKET_TAX_BELOW: Dict[FilingStatus, Sequence[float]] = {
+    status: _tax_below(brackets)
+    for status, brackets in TAX_BRACKETS_2025.items()
+}
+
+
+# =============================================================================
+# KERNELS
+# =============================================================================
+
+@njit(cache=True)
+def bracket_walk(taxable, lowers, uppers, rates):
+    """
+    Walk the brackets once for a non-negative taxable income.
+
+    Returns:
+        (unrounded tax, marginal rate, number of brackets the income reaches)
+    """
+    total = 0.0
+    n = len(rates)
+    for i in range(n):
+        if taxable <= uppers[i]:
+            total += (taxable - lowers[i]) * rates[i]
+            return total, rates[i], i + 1
+        total += (uppers[i] - lowers[i]) * rates[i]
+    return total, rates[n - 1], n
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def bracket_lookup(taxable, lowers, uppers, rates, tax_below):
+        """bracket_walk for a non-negative income via binary search (same results)."""
+        i = np.searchsorted(uppers, taxable)
+        return tax_below[i] + (taxable - lowers[i]) * rates[i], rates[i], i + 1
+else:
+    def bracket_lookup(taxable, lowers, uppers, rates, tax_below):
+        """bracket_walk for a non-negative income via binary search (same results)."""
+        i = bisect_left(uppers, taxable)
+        return tax_below[i] + (taxable - lowers[i]) * rates[i], rates[i], i + 1
@@ -12,24 +12,32 @@ All bracket lookups, tax math, and projections happen here with hardcoded values
 """
 
 import copy
+import itertools
+import threading
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from tax_constants import (
     FilingStatus,
     TAX_BRACKETS_2025,
     STANDARD_DEDUCTION_2025,
     CONTRIBUTION_LIMITS_2025,
-    PAY_PERIODS_PER_YEAR,
     CHILD_TAX_CREDIT_2025,
-    calculate_federal_tax,
-    get_marginal_rate,
-    get_effective_rate
+    calculate_federal_tax
 )
+from tax_kernels import BRACKET_TABLES, BRACKET_TAX_BELOW, bracket_lookup
 from models import (
     UserFinancialProfile,
     PayFrequency,
+    PAY_PERIODS_BY_FREQUENCY,
     TaxResult,
     TaxBracketBreakdown,
     SimulationResult,
@@ -40,6 +48,54 @@ from models import (
 )
 
 
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+# Chat, simulation and paystub flows keep recalculating the same profile
+# snapshot. Results are memoized on (tax_year, profile fingerprint); a changed
+# input yields a new fingerprint, so entries never need explicit invalidation.
+TAX_RESULT_CACHE_SIZE = 2048
+_tax_result_cache: "OrderedDict[Tuple[int, bytes], TaxResult]" = OrderedDict()
+_tax_result_cache_lock = threading.Lock()
+
+
+def clear_tax_result_cache() -> None:
+    """Drop all memoized tax results."""
+    with _tax_result_cache_lock:
+        _tax_result_cache.clear()
+
+
+def _money(value: float) -> float:
+    """Round to cents as a float (model_construct does no int->float coercion)."""
+    return round(float(value), 2)
+
+
+def _bracket_row(lower: float, upper: float, rate: float, taxable_income: float) -> TaxBracketBreakdown:
+    """Breakdown entry for the part of taxable_income falling in one bracket."""
+    income_in_bracket = min(taxable_income, upper) - lower
+    return TaxBracketBreakdown.model_construct(
+        bracket_start=lower,
+        bracket_end=upper if upper != float('inf') else float(taxable_income),
+        rate=rate,
+        income_in_bracket=_money(income_in_bracket),
+        tax_in_bracket=_money(income_in_bracket * rate)
+    )
+
+
+# Every bracket below the one an income ends in is filled completely, and its
+# (frozen) breakdown entry is the same for every result - build those once and
+# share them instead of allocating fresh models per calculation.
+_FULL_BRACKET_ROWS: Dict[FilingStatus, Tuple[TaxBracketBreakdown, ...]] = {
+    status: tuple(
+        _bracket_row(float(lower), float(upper), float(rate), float(upper))
+        for lower, upper, rate in zip(*table)
+        if upper != float('inf')
+    )
+    for status, table in BRACKET_TABLES.items()
+}
+
+
 # =============================================================================
 # TAX CALCULATION ENGINE
 # =============================================================================
@@ -60,19 +116,41 @@ class TaxCalculator:
         
         This is the authoritative calculation - results from here
         should be used, not LLM estimates.
+        
+        Results are memoized by profile fingerprint; the returned TaxResult
+        may be shared between callers and should be treated as read-only.
         """
+        key = (self.tax_year, profile.fingerprint())
+        
+        with _tax_result_cache_lock:
+            cached = _tax_result_cache.get(key)
+            if cached is not None:
+                _tax_result_cache.move_to_end(key)
+                return cached
+        
+        result = self._compute_tax(profile)
+        
+        with _tax_result_cache_lock:
+            _tax_result_cache[key] = result
+            if len(_tax_result_cache) > TAX_RESULT_CACHE_SIZE:
+                _tax_result_cache.popitem(last=False)
+        
+        return result
+    
+    def _compute_tax(self, profile: UserFinancialProfile) -> TaxResult:
+        """Run the full tax calculation for a profile (uncached)."""
         # Step 1: Calculate total gross income
         gross_income = self._calculate_gross_income(profile)
         
         # Step 2: Calculate adjustments (above-the-line deductions)
-        adjustments = self._calculate_adjustments(profile)
+        adjustments = self._calculate_adjustments(profile, gross_income)
         
         # Step 3: AGI
         agi = max(0, gross_income - adjustments)
         
         # Step 4: Determine deduction (standard vs itemized)
         standard_deduction = profile.standard_deduction
-        itemized_deduction = self._calculate_itemized_deductions(profile)
+        itemized_deduction = self._calculate_itemized_deductions(profile, gross_income - adjustments)
         
         if profile.prefers_itemized and itemized_deduction > standard_deduction:
             deduction_type = "itemized"
@@ -84,8 +162,8 @@ class TaxCalculator:
         # Step 5: Taxable income
         taxable_income = max(0, agi - deduction_amount)
         
-        # Step 6: Calculate federal tax with bracket breakdown
-        federal_tax, bracket_breakdown = self._calculate_tax_with_breakdown(
+        # Step 6: Calculate federal tax, marginal rate and bracket breakdown
+        federal_tax, marginal_rate, bracket_breakdown = self._calculate_tax_with_breakdown(
             taxable_income, 
             profile.filing_status
         )
@@ -111,35 +189,36 @@ class TaxCalculator:
             total_payments = profile.ytd_federal_withheld + profile.estimated_payments_made
             
             if profile.current_pay_period > 0:
-                total_periods = PAY_PERIODS_PER_YEAR[profile.pay_frequency.value]
+                total_periods = PAY_PERIODS_BY_FREQUENCY[profile.pay_frequency]
                 payment_projection_factor = total_periods / profile.current_pay_period
                 total_payments = (profile.ytd_federal_withheld * payment_projection_factor) + profile.estimated_payments_made
         
         # Step 11: Refund or owed
         refund_or_owed = total_payments - total_tax
         
-        # Get rates
-        marginal_rate = get_marginal_rate(taxable_income, profile.filing_status)
-        effective_rate = get_effective_rate(taxable_income, profile.filing_status)
+        # Effective rate from the same bracket walk as the tax itself
+        effective_rate = round((federal_tax / taxable_income) * 100, 2) if taxable_income > 0 else 0.0
         
-        return TaxResult(
-            gross_income=round(gross_income, 2),
-            adjustments=round(adjustments, 2),
-            adjusted_gross_income=round(agi, 2),
+        # Every value below comes from the engine itself, so skip validation
+        # and build the result directly. API input models keep full validation.
+        return TaxResult.model_construct(
+            gross_income=_money(gross_income),
+            adjustments=_money(adjustments),
+            adjusted_gross_income=_money(agi),
             deduction_type=deduction_type,
-            deduction_amount=round(deduction_amount, 2),
-            taxable_income=round(taxable_income, 2),
-            federal_tax=round(federal_tax, 2),
+            deduction_amount=_money(deduction_amount),
+            taxable_income=_money(taxable_income),
+            federal_tax=_money(federal_tax),
             bracket_breakdown=bracket_breakdown,
-            marginal_rate=marginal_rate,
-            effective_rate=effective_rate,
-            self_employment_tax=round(se_tax, 2),
-            child_tax_credit=round(child_credit, 2),
-            other_credits=round(other_credits, 2),
-            total_credits=round(total_credits, 2),
-            total_tax_liability=round(total_tax, 2),
-            total_payments_and_withholding=round(total_payments, 2),
-            refund_or_owed=round(refund_or_owed, 2),
+            marginal_rate=float(marginal_rate),
+            effective_rate=float(effective_rate),
+            self_employment_tax=_money(se_tax),
+            child_tax_credit=_money(child_credit),
+            other_credits=_money(other_credits),
+            total_credits=_money(total_credits),
+            total_tax_liability=_money(total_tax),
+            total_payments_and_withholding=_money(total_payments),
+            refund_or_owed=_money(refund_or_owed),
             tax_year=self.tax_year,
             is_projection=True
         )
@@ -150,7 +229,7 @@ class TaxCalculator:
         if profile.projected_annual_income > 0:
             wage_income = profile.projected_annual_income
         elif profile.ytd_income > 0 and profile.current_pay_period > 0:
-            total_periods = PAY_PERIODS_PER_YEAR[profile.pay_frequency.value]
+            total_periods = PAY_PERIODS_BY_FREQUENCY[profile.pay_frequency]
             wage_income = (profile.ytd_income / profile.current_pay_period) * total_periods
         else:
             wage_income = profile.ytd_income
@@ -168,8 +247,8 @@ class TaxCalculator:
         
         return total_income
     
-    def _calculate_adjustments(self, profile: UserFinancialProfile) -> float:
-        """Calculate above-the-line deductions."""
+    def _calculate_adjustments(self, profile: UserFinancialProfile, gross_income: float) -> float:
+        """Calculate above-the-line deductions (gross_income from _calculate_gross_income)."""
         adjustments = 0.0
         
         # Traditional 401(k) - already excluded from W-2 wages
@@ -185,7 +264,7 @@ class TaxCalculator:
         # If covered by workplace plan, may be limited
         if profile.has_workplace_retirement_plan:
             # Simplified phase-out (full implementation would check income)
-            agi_estimate = self._calculate_gross_income(profile)
+            agi_estimate = gross_income
             if profile.filing_status == FilingStatus.SINGLE and agi_estimate > 89000:
                 ira_deduction = 0  # Fully phased out
             elif profile.filing_status == FilingStatus.MARRIED_FILING_JOINTLY and agi_estimate > 146000:
@@ -210,8 +289,8 @@ class TaxCalculator:
         
         return adjustments
     
-    def _calculate_itemized_deductions(self, profile: UserFinancialProfile) -> float:
-        """Calculate itemized deductions."""
+    def _calculate_itemized_deductions(self, profile: UserFinancialProfile, agi: float) -> float:
+        """Calculate itemized deductions (agi: gross income minus adjustments)."""
         itemized = 0.0
         
         # State and local taxes (SALT) - capped at $10,000
@@ -225,7 +304,6 @@ class TaxCalculator:
         itemized += profile.charitable_donations
         
         # Medical expenses (only amount exceeding 7.5% of AGI)
-        agi = self._calculate_gross_income(profile) - self._calculate_adjustments(profile)
         medical_threshold = agi * 0.075
         medical_deductible = max(0, profile.medical_expenses - medical_threshold)
         itemized += medical_deductible
@@ -236,42 +314,24 @@ class TaxCalculator:
         self, 
         taxable_income: float, 
         filing_status: FilingStatus
-    ) -> Tuple[float, List[TaxBracketBreakdown]]:
-        """Calculate tax with detailed bracket breakdown."""
+    ) -> Tuple[float, float, List[TaxBracketBreakdown]]:
+        """Calculate tax, marginal rate and detailed bracket breakdown."""
+        lowers, uppers, rates = BRACKET_TABLES[filing_status]
         if taxable_income <= 0:
-            return 0.0, []
+            return 0.0, float(rates[0]), []
         
-        brackets = TAX_BRACKETS_2025[filing_status]
-        total_tax = 0.0
-        breakdown = []
-        remaining_income = taxable_income
-        prev_limit = 0
+        # The numeric lookup runs in the kernel; the models are for reporting only
+        total_tax, marginal_rate, reached = bracket_lookup(
+            float(taxable_income), lowers, uppers, rates, BRACKET_TAX_BELOW[filing_status]
+        )
         
-        for limit, rate in brackets:
-            bracket_size = limit - prev_limit if limit != float('inf') else remaining_income
-            taxable_in_bracket = min(remaining_income, bracket_size)
-            
-            if taxable_in_bracket <= 0:
-                break
-            
-            tax_in_bracket = taxable_in_bracket * rate
-            total_tax += tax_in_bracket
-            
-            breakdown.append(TaxBracketBreakdown(
-                bracket_start=prev_limit,
-                bracket_end=limit if limit != float('inf') else prev_limit + taxable_in_bracket,
-                rate=rate,
-                income_in_bracket=round(taxable_in_bracket, 2),
-                tax_in_bracket=round(tax_in_bracket, 2)
-            ))
-            
-            remaining_income -= taxable_in_bracket
-            prev_limit = limit
-            
-            if remaining_income <= 0:
-                break
+        last = reached - 1
+        breakdown = list(_FULL_BRACKET_ROWS[filing_status][:last])
+        breakdown.append(_bracket_row(
+            float(lowers[last]), float(uppers[last]), float(rates[last]), taxable_income
+        ))
         
-        return round(total_tax, 2), breakdown
+        return round(total_tax, 2), float(marginal_rate), breakdown
     
     def _calculate_self_employment_tax(self, profile: UserFinancialProfile) -> float:
         """Calculate self-employment tax (Social Security + Medicare)."""
@@ -363,7 +423,15 @@ class TaxSimulator:
         
         # Calculate baseline
         baseline_result = self.calculator.calculate_tax(self.profile)
-        
+        return self._simulate(baseline_result, changes, scenario_name)
+    
+    def _simulate(
+        self,
+        baseline_result: TaxResult,
+        changes: Dict[str, Any],
+        scenario_name: str
+    ) -> SimulationResult:
+        """Compare one set of changes against an already computed baseline."""
         # Create modified profile
         modified_profile = self._apply_changes(self.profile, changes)
         
@@ -384,13 +452,13 @@ class TaxSimulator:
         else:
             summary = f"This change would increase your taxes by ${abs(tax_diff):,.2f}."
         
-        return SimulationResult(
+        return SimulationResult.model_construct(
             scenario_name=scenario_name,
             baseline=baseline_result,
             simulated=simulated_result,
-            tax_difference=round(tax_diff, 2),
-            refund_difference=round(refund_diff, 2),
-            effective_rate_change=round(rate_diff, 2),
+            tax_difference=_money(tax_diff),
+            refund_difference=_money(refund_diff),
+            effective_rate_change=_money(rate_diff),
             is_beneficial=is_beneficial,
             summary=summary
         )
@@ -401,40 +469,24 @@ class TaxSimulator:
         changes: Dict[str, Any]
     ) -> UserFinancialProfile:
         """Apply changes to create a modified profile."""
-        # Deep copy to avoid modifying original
-        modified = profile.model_copy(deep=True)
-        
+        update = {}
         for key, value in changes.items():
             # Handle "extra_" prefix (additive changes)
             if key.startswith('extra_'):
                 actual_field = key.replace('extra_', 'ytd_')
-                if hasattr(modified, actual_field):
-                    current_value = getattr(modified, actual_field)
-                    setattr(modified, actual_field, current_value + value)
-                continue
-            
-            # Handle filing status specially
-            if key == 'filing_status':
-                if isinstance(value, str):
-                    modified.filing_status = FilingStatus(value)
-                else:
-                    modified.filing_status = value
-                continue
-            
-            # Handle pay frequency specially
-            if key == 'pay_frequency':
-                if isinstance(value, str):
-                    modified.pay_frequency = PayFrequency(value)
-                else:
-                    modified.pay_frequency = value
+                if hasattr(profile, actual_field):
+                    update[actual_field] = getattr(profile, actual_field) + value
                 continue
             
-            # Direct field assignment
-            if hasattr(modified, key):
-                setattr(modified, key, value)
+            # Direct field assignment; validation coerces enum values
+            # such as filing_status="married_filing_jointly"
+            if hasattr(profile, key):
+                update[key] = value
         
-        # Recalculate projections
-        modified = modified.model_validate(modified.model_dump())
+        # Shallow copy, then validate only the changed fields, which also
+        # recalculates projections - no full dump and re-parse per scenario
+        modified = profile.model_copy()
+        modified.apply_updates(update)
         
         return modified
     
@@ -451,15 +503,16 @@ class TaxSimulator:
         Returns:
             List of SimulationResults
         """
-        results = []
+        if self.profile is None:
+            raise ValueError("No profile set. Call set_profile() first.")
         
-        for scenario in scenarios:
-            name = scenario.get('name', 'Unnamed')
-            changes = scenario.get('changes', {})
-            result = self.run_simulation(changes, name)
-            results.append(result)
+        # Every scenario shares one baseline, so compute it once
+        baseline_result = self.calculator.calculate_tax(self.profile)
         
-        return results
+        return [
+            self._simulate(baseline_result, scenario.get('changes', {}), scenario.get('name', 'Unnamed'))
+            for scenario in scenarios
+        ]
     
     def find_optimal_401k(self) -> SimulationResult:
         """Find the tax impact of maxing out 401(k)."""
@@ -505,9 +558,7 @@ class RecommendationEngine:
     """
     
     def __init__(self):
-        self.current_date = date.today()
         self.calculator = TaxCalculator()
-        self.simulator = TaxSimulator()
     
     def generate_recommendations(
         self, 
@@ -515,17 +566,21 @@ class RecommendationEngine:
     ) -> RecommendationReport:
         """
         Generate complete recommendation report.
+        
+        Per-call state (today's date, the simulator) is kept local, so one
+        engine can be shared across requests.
         """
-        self.simulator.set_profile(profile)
+        current_date = date.today()
+        simulator = TaxSimulator(profile)
         
         # Calculate current projection
         current_result = self.calculator.calculate_tax(profile)
         
         # Time calculations
-        year_end = date(self.current_date.year, 12, 31)
-        days_remaining = (year_end - self.current_date).days
+        year_end = date(current_date.year, 12, 31)
+        days_remaining = (year_end - current_date).days
         
-        total_periods = PAY_PERIODS_PER_YEAR[profile.pay_frequency.value]
+        total_periods = PAY_PERIODS_BY_FREQUENCY[profile.pay_frequency]
         remaining_periods = max(0, total_periods - profile.current_pay_period)
         
         basic_recs = []
@@ -539,7 +594,7 @@ class RecommendationEngine:
         
         # 1. 401(k) Optimization
         if profile.remaining_401k_room > 0:
-            sim_401k = self.simulator.find_optimal_401k()
+            sim_401k = simulator.find_optimal_401k()
             potential_savings = abs(sim_401k.tax_difference) if sim_401k.is_beneficial else 0
             
             per_paycheck = profile.remaining_401k_room / remaining_periods if remaining_periods > 0 else 0
@@ -566,7 +621,7 @@ class RecommendationEngine:
         
         # 2. HSA Optimization
         if profile.remaining_hsa_room > 0:
-            sim_hsa = self.simulator.find_optimal_hsa()
+            sim_hsa = simulator.find_optimal_hsa()
             potential_savings = abs(sim_hsa.tax_difference) if sim_hsa.is_beneficial else 0
             
             basic_recs.append(TaxRecommendation(
@@ -580,7 +635,7 @@ class RecommendationEngine:
                 implementation_cost=profile.remaining_hsa_room,
                 net_benefit=potential_savings,
                 action_required="Increase payroll HSA deduction or make a direct contribution to your HSA.",
-                deadline=date(self.current_date.year + 1, 4, 15),  # Can contribute until tax filing
+                deadline=date(current_date.year + 1, 4, 15),  # Can contribute until tax filing
                 remaining_contribution_room=profile.remaining_hsa_room,
                 complexity="basic",
                 requires_professional=False
@@ -593,7 +648,7 @@ class RecommendationEngine:
         
         ira_room = max(0, ira_limit - profile.ytd_ira_traditional)
         if ira_room > 0 and not profile.has_workplace_retirement_plan:
-            sim_ira = self.simulator.run_simulation({'extra_ira_traditional': ira_room}, "Max IRA")
+            sim_ira = simulator.run_simulation({'extra_ira_traditional': ira_room}, "Max IRA")
             potential_savings = abs(sim_ira.tax_difference) if sim_ira.is_beneficial else 0
             
             basic_recs.append(TaxRecommendation(
@@ -606,7 +661,7 @@ class RecommendationEngine:
                 potential_tax_savings=potential_savings,
                 implementation_cost=ira_room,
                 action_required="Open or contribute to a Traditional IRA at a brokerage.",
-                deadline=date(self.current_date.year + 1, 4, 15),
+                deadline=date(current_date.year + 1, 4, 15),
                 remaining_contribution_room=ira_room,
                 complexity="basic",
                 requires_professional=False
@@ -661,7 +716,7 @@ class RecommendationEngine:
                            f"before January 15.",
                 potential_tax_savings=0,  # Doesn't save tax, avoids penalty
                 action_required="Make estimated payment via IRS Direct Pay or EFTPS.",
-                deadline=date(self.current_date.year + 1, 1, 15),
+                deadline=date(current_date.year + 1, 1, 15),
                 complexity="intermediate",
                 requires_professional=False,
                 warnings=["Underpayment penalty may apply if you owe >$1,000"]
@@ -855,7 +910,7 @@ class RecommendationEngine:
                 potential_tax_savings=0,  # Tax-free growth, not immediate savings
                 action_required="1) Contribute $7,000 to Traditional IRA (non-deductible). "
                                "2) Wait a few days. 3) Convert to Roth. File Form 8606.",
-                deadline=date(self.current_date.year + 1, 4, 15),
+                deadline=date(current_date.year + 1, 4, 15),
                 complexity="intermediate",
                 requires_professional=False,
                 warnings=["Pro-rata rule applies if you have existing Traditional IRA balances"]
@@ -997,7 +1052,7 @@ class RecommendationEngine:
                 potential_tax_savings=sep_limit * current_result.marginal_rate,
                 action_required="Open a SEP-IRA at any brokerage (Fidelity, Schwab, Vanguard). "
                                "Can contribute until April 15 (or Oct 15 with extension).",
-                deadline=date(self.current_date.year + 1, 4, 15),
+                deadline=date(current_date.year + 1, 4, 15),
                 complexity="intermediate",
                 requires_professional=False,
                 warnings=["If you have employees, must contribute equal % for them too"]
@@ -1170,7 +1225,7 @@ class RecommendationEngine:
                 potential_tax_savings=profile.remaining_hsa_room * current_result.marginal_rate,
                 action_required="Max out HSA. Invest it (don't leave as cash). Pay medical expenses "
                                "out-of-pocket and save receipts. Reimburse yourself later.",
-                deadline=date(self.current_date.year + 1, 4, 15),
+                deadline=date(current_date.year + 1, 4, 15),
                 complexity="intermediate",
                 requires_professional=False,
                 warnings=["Must have HDHP insurance to contribute", "Keep receipts forever"]
@@ -1235,8 +1290,18 @@ class RecommendationEngine:
                 warnings=["Irrevocable - cannot undo", "Complex annual filings required", "Legal fees $2k-5k"]
             ))
         
-        # Calculate max savings
-        max_savings = sum(r.potential_tax_savings for r in basic_recs + advanced_recs)
+        # Total savings and deadline buckets in one pass over all recommendations
+        year_end_date = date(current_date.year, 12, 31)
+        max_savings = 0.0
+        immediate, year_end, next_year = [], [], []
+        for rec in itertools.chain(basic_recs, advanced_recs):
+            max_savings += rec.potential_tax_savings
+            if not rec.deadline:
+                next_year.append(rec)
+            elif rec.deadline <= year_end_date:
+                immediate.append(rec)
+            else:
+                year_end.append(rec)
         
         # Optimal projection (if all basic recs implemented)
         combined_changes = {}
@@ -1246,18 +1311,11 @@ class RecommendationEngine:
             combined_changes['extra_hsa'] = profile.remaining_hsa_room
         
         if combined_changes:
-            optimal_sim = self.simulator.run_simulation(combined_changes, "Optimal")
+            optimal_sim = simulator.run_simulation(combined_changes, "Optimal")
             optimal_owed = optimal_sim.simulated.refund_or_owed
         else:
             optimal_owed = current_result.refund_or_owed
         
-        # Categorize by timing
-        immediate = [r for r in basic_recs + advanced_recs 
-                    if r.deadline and r.deadline <= date(self.current_date.year, 12, 31)]
-        year_end = [r for r in basic_recs + advanced_recs 
-                   if r.deadline and r.deadline > date(self.current_date.year, 12, 31)]
-        next_year = [r for r in basic_recs + advanced_recs if not r.deadline]
-        
         return RecommendationReport(
             profile_id=profile.profile_id,
             current_projected_owed=round(-current_result.refund_or_owed if is_owing else 0, 2),
@@ -1291,12 +1349,38 @@ class IncomeProjector:
         """
         Project annual income from YTD data.
         """
-        total_periods = PAY_PERIODS_PER_YEAR[pay_frequency.value]
+        total_periods = PAY_PERIODS_BY_FREQUENCY[pay_frequency]
         if current_pay_period <= 0:
             return ytd_income
         
         return (ytd_income / current_pay_period) * total_periods
     
+    @staticmethod
+    def project_annual_income_batch(profiles: Sequence[UserFinancialProfile]) -> List[float]:
+        """
+        Project annual income from YTD data for many profiles at once.
+        
+        Same result as project_annual_income per profile; with NumPy the
+        division and scaling run as one array operation (bulk recomputes).
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                IncomeProjector.project_annual_income(p.ytd_income, p.current_pay_period, p.pay_frequency)
+                for p in profiles
+            ]
+        
+        count = len(profiles)
+        ytd = np.fromiter((p.ytd_income for p in profiles), dtype=np.float64, count=count)
+        periods = np.fromiter((p.current_pay_period for p in profiles), dtype=np.float64, count=count)
+        per_year = np.fromiter(
+            (PAY_PERIODS_BY_FREQUENCY[p.pay_frequency] for p in profiles), dtype=np.float64, count=count
+        )
+        
+        has_period = periods > 0
+        projected = ytd.copy()
+        projected[has_period] = (ytd[has_period] / periods[has_period]) * per_year[has_period]
+        return projected.tolist()
+    
     @staticmethod
     def calculate_remaining_periods(
         current_date: date,
@@ -4,9 +4,12 @@ TaxGuard AI - Test Suite
 Comprehensive tests for all backend components.
 """
 
+import asyncio
 import pytest
+from pydantic import ValidationError
 from datetime import date
 from decimal import Decimal
+from types import SimpleNamespace
 
 # Import modules to test
 import sys
@@ -18,17 +21,22 @@ from tax_constants import (
     STANDARD_DEDUCTION_2025,
     CONTRIBUTION_LIMITS_2025,
     calculate_federal_tax,
+    calculate_federal_tax_batch,
     get_marginal_rate,
     get_effective_rate,
 )
 from models import (
     UserFinancialProfile,
+    IncomeSource,
     PayFrequency,
     PaystubData,
     TaxResult,
 )
+import pii_redaction
 from pii_redaction import (
+    PII_PATTERNS,
     PIIRedactor,
+    W2Redactor,
     redact_sensitive_data,
     RedactionResult,
 )
@@ -38,6 +46,8 @@ from tax_simulator import (
     RecommendationEngine,
     IncomeProjector,
 )
+from tax_kernels import BRACKET_TABLES, BRACKET_TAX_BELOW, bracket_lookup, bracket_walk
+from llm_cache import LLMCache, make_cache_key
 
 
 # =============================================================================
@@ -107,6 +117,32 @@ class TestTaxConstants:
         
         assert abs(tax - expected) < 1  # Allow for rounding
     
+    def test_calculate_federal_tax_batch_matches_scalar(self):
+        """Batch calculation should match the per-income calculation."""
+        incomes = [-10000, 0, 10000, 50000, 250000, 1000000]
+        
+        for status in FilingStatus:
+            batch = calculate_federal_tax_batch(incomes, status)
+            expected = [calculate_federal_tax(income, status) for income in incomes]
+            assert batch == pytest.approx(expected)
+    
+    def test_bracket_walk_matches_scalar(self):
+        """Kernel walk should agree with the reference tax and marginal rate."""
+        for status in FilingStatus:
+            for income in [1.0, 11925, 48475.5, 250000, 2000000]:
+                tax, marginal, _ = bracket_walk(float(income), *BRACKET_TABLES[status])
+                assert round(tax, 2) == calculate_federal_tax(income, status)
+                assert marginal == get_marginal_rate(income, status)
+    
+    def test_bracket_lookup_matches_walk(self):
+        """Binary-search lookup should give exactly the walk's results."""
+        for status in FilingStatus:
+            lowers, uppers, rates = BRACKET_TABLES[status]
+            incomes = [0.0, 1.0, 48475.5, 2000000.0] + [float(u) for u in uppers[:-1]]
+            for income in incomes:
+                looked_up = bracket_lookup(income, lowers, uppers, rates, BRACKET_TAX_BELOW[status])
+                assert looked_up == bracket_walk(income, lowers, uppers, rates)
+    
     def test_get_marginal_rate_first_bracket(self):
         """Marginal rate should be 10% for low income."""
         rate = get_marginal_rate(5000, FilingStatus.SINGLE)
@@ -195,6 +231,77 @@ class TestPIIRedaction:
         assert "123-45-6789" not in result.redacted_text
         assert "987-65-4321" not in result.redacted_text
         assert result.redaction_count >= 2
+    
+    def test_redact_batch_matches_single(self):
+        """Batch redaction should match redacting each text on its own."""
+        texts = ["SSN: 123-45-6789", "", "Email: john.doe@example.com"]
+        redactor = PIIRedactor(use_ner=False)
+        batch = redactor.redact_batch(texts)
+        
+        assert [r.redacted_text for r in batch] == [
+            redactor.redact_sensitive_data(text).redacted_text for text in texts
+        ]
+    
+    def test_async_redaction_numbers_tokens_per_document(self):
+        """Concurrent redactions on the pool should keep token numbering per document."""
+        texts = ["SSN: 123-45-6789, Spouse SSN: 987-65-4321"] * 8
+        redactor = PIIRedactor(use_ner=False)
+        
+        async def redact_all():
+            return await asyncio.gather(*(redactor.aredact_sensitive_data(t) for t in texts))
+        
+        results = asyncio.run(redact_all())
+        
+        assert len(results) == len(texts)
+        for result in results:
+            assert "[SSN_1]" in result.redacted_text
+            assert "[SSN_2]" in result.redacted_text
+            assert "[SSN_3]" not in result.redacted_text
+    
+    def test_phone_with_extension_is_redacted(self):
+        """A digit guard, not a word boundary, should end the phone pattern."""
+        result = PIIRedactor(use_ner=False).redact_sensitive_data("Call (555) 123-4567x89")
+        
+        assert "123-4567" not in result.redacted_text
+        assert "PHONE" in result.pii_types_found
+    
+    def test_address_cannot_claim_bank_account(self):
+        """A loose ADDRESS match ("00 Acct") must not shadow the account number."""
+        result = PIIRedactor(use_ner=False).redact_sensitive_data(
+            "Direct Deposit 1,234.56 Acct 12345678"
+        )
+        
+        assert "12345678" not in result.redacted_text
+        assert "[BANK_ACCOUNT_1]" in result.redacted_text
+        assert "ADDRESS" not in result.pii_types_found
+    
+    def test_w2_redactor_leaves_shared_patterns_alone(self):
+        """W-2 patterns should apply only to W2Redactor."""
+        text = "Control number: AB12345"
+        w2_result = W2Redactor(use_ner=False).redact_sensitive_data(text)
+        
+        assert "AB12345" not in w2_result.redacted_text
+        assert "CONTROL_NUMBER" in w2_result.pii_types_found
+        assert "CONTROL_NUMBER" not in PII_PATTERNS
+        assert "AB12345" in redact_sensitive_data(text, use_ner=False)
+    
+    def test_ner_runs_on_last_first_names(self, monkeypatch):
+        """Every text should reach NER, including "Last, First" payroll names."""
+        seen = []
+        
+        def fake_nlp(text):
+            seen.append(text)
+            start = text.index("Smith, John")
+            entity = SimpleNamespace(label_="PERSON", start_char=start, end_char=start + 11)
+            return SimpleNamespace(ents=[entity])
+        
+        monkeypatch.setattr(pii_redaction, "get_ner_model", lambda: fake_nlp)
+        text = "Employee: Smith, John  Net pay: 2,150.00"
+        result = PIIRedactor(use_ner=True).redact_sensitive_data(text)
+        
+        assert seen == [text]
+        assert "Smith" not in result.redacted_text
+        assert "USER_NAME" in result.pii_types_found
 
 
 # =============================================================================
@@ -265,6 +372,45 @@ class TestDataModels:
         
         assert senior_profile.remaining_401k_room > young_profile.remaining_401k_room
     
+    def test_income_source_aggregates(self):
+        """Per-owner and withholding totals should come from all income sources."""
+        profile = UserFinancialProfile(income_sources=[
+            IncomeSource(ytd_income=50000, ytd_federal_withheld=5000, current_pay_period=20),
+            IncomeSource(owner="spouse", source_type="self_employment", ytd_income=20000),
+        ])
+        
+        assert profile.ytd_income == 70000
+        assert profile.taxpayer_income == pytest.approx(65000)
+        assert profile.spouse_income == 20000
+        assert profile.projected_annual_withholding == pytest.approx(6500)
+        assert profile.has_self_employment
+    
+    def test_apply_updates_is_all_or_nothing(self):
+        """An invalid value should leave every field of the profile unchanged."""
+        profile = UserFinancialProfile(ytd_income=50000, current_pay_period=10)
+        
+        with pytest.raises(ValidationError):
+            profile.apply_updates({"ytd_income": 90000, "confidence_score": 5})
+        assert profile.ytd_income == 50000
+        assert profile.projected_annual_income == pytest.approx(130000)
+        
+        profile.apply_updates({"ytd_income": 60000})
+        assert profile.projected_annual_income == pytest.approx(156000)
+    
+    def test_income_source_aggregates_follow_in_place_edits(self):
+        """Editing income_sources in place should be reflected in the totals."""
+        profile = UserFinancialProfile(income_sources=[
+            IncomeSource(ytd_income=50000, ytd_federal_withheld=5000, current_pay_period=20),
+        ])
+        profile.income_sources.append(
+            IncomeSource(source_type="other", ytd_income=3000, ytd_federal_withheld=3000)
+        )
+        assert profile.projected_annual_withholding == pytest.approx(9500)
+        
+        profile.income_sources[0].ytd_income = 60000
+        assert profile.taxpayer_income == pytest.approx(81000)
+        assert profile.model_copy().taxpayer_income == pytest.approx(81000)
+    
     def test_paystub_data_pay_frequency_normalization(self):
         """Pay frequency should be normalized from various formats."""
         data1 = PaystubData(pay_frequency="bi-weekly")
@@ -272,6 +418,37 @@ class TestDataModels:
         
         data2 = PaystubData(pay_frequency="every other week")
         assert data2.pay_frequency == PayFrequency.BIWEEKLY
+    
+    def test_paystub_data_is_frozen(self):
+        """Extracted paystub data should be immutable once built."""
+        data = PaystubData(gross_pay=2500)
+        
+        with pytest.raises(ValidationError):
+            data.gross_pay = 3000
+    
+    def test_apply_updates_validates_and_recalculates(self):
+        """apply_updates should coerce values and refresh projections in place."""
+        profile = UserFinancialProfile(
+            ytd_income=50000,
+            pay_frequency=PayFrequency.BIWEEKLY,
+            current_pay_period=20
+        )
+        before = profile.projected_annual_income
+        
+        profile.apply_updates({"ytd_income": "60000", "age": 70})
+        
+        assert profile.ytd_income == 60000.0
+        assert profile.projected_annual_income > before
+        assert profile.standard_deduction > STANDARD_DEDUCTION_2025[FilingStatus.SINGLE]
+    
+    def test_choice_fields_reject_unknown_values(self):
+        """Fixed-choice string fields should only accept their listed values."""
+        assert UserFinancialProfile(hsa_coverage_type="family").hsa_coverage_type == "family"
+        
+        with pytest.raises(ValidationError):
+            UserFinancialProfile(hsa_coverage_type="household")
+        with pytest.raises(ValidationError):
+            IncomeSource(owner="dependent")
 
 
 # =============================================================================
@@ -380,6 +557,35 @@ class TestTaxCalculator:
         assert result_with_kids.child_tax_credit > 0
         assert result_with_kids.total_tax_liability < result_no_kids.total_tax_liability
 
+    def test_calculate_tax_cached_by_fingerprint(self, calculator, simple_profile):
+        """Identical profile snapshots should reuse the cached result."""
+        twin = simple_profile.model_copy(update={"profile_id": "other-id"})
+
+        assert twin.fingerprint() == simple_profile.fingerprint()
+        assert calculator.calculate_tax(twin) is calculator.calculate_tax(simple_profile)
+
+    def test_calculate_tax_cache_sees_changes(self, calculator, simple_profile):
+        """Changing a tax-relevant field should produce a fresh result."""
+        before = calculator.calculate_tax(simple_profile)
+        simple_profile.ytd_federal_withheld = 20000
+        after = calculator.calculate_tax(simple_profile)
+
+        assert after is not before
+        assert after.refund_or_owed > before.refund_or_owed
+
+    def test_calculate_tax_result_round_trips(self, calculator, simple_profile):
+        """Engine-built results should survive full validation unchanged."""
+        result = calculator.calculate_tax(simple_profile)
+
+        assert TaxResult.model_validate(result.model_dump()) == result
+
+    def test_cached_result_is_read_only(self, calculator, simple_profile):
+        """Shared cached results should reject mutation."""
+        result = calculator.calculate_tax(simple_profile)
+
+        with pytest.raises(ValidationError):
+            result.refund_or_owed = 0.0
+
 
 # =============================================================================
 # TAX SIMULATOR TESTS
@@ -457,6 +663,20 @@ class TestTaxSimulator:
         
         # Result should have different tax calculation
         assert result.simulated.deduction_amount != result.baseline.deduction_amount
+    
+    def test_multiple_simulations_match_single_runs(self, simulator):
+        """Batched scenarios should share a baseline and match run_simulation."""
+        scenarios = [
+            {"name": "Add HSA", "changes": {"extra_hsa": 1000}},
+            {"name": "Get Married", "changes": {"filing_status": "married_filing_jointly"}},
+        ]
+        results = simulator.run_multiple_simulations(scenarios)
+        
+        assert [r.scenario_name for r in results] == ["Add HSA", "Get Married"]
+        assert results[0].baseline is results[1].baseline
+        for scenario, result in zip(scenarios, results):
+            single = simulator.run_simulation(scenario["changes"], scenario["name"])
+            assert result.tax_difference == single.tax_difference
 
 
 # =============================================================================
@@ -504,6 +724,16 @@ class TestRecommendationEngine:
         )
         assert has_401k_rec
     
+    def test_engine_reusable_across_profiles(self, engine, profile_owing_taxes):
+        """A shared engine should not carry state from one profile to the next."""
+        first = engine.generate_recommendations(profile_owing_taxes)
+        engine.generate_recommendations(UserFinancialProfile(ytd_401k_traditional=23500))
+        again = engine.generate_recommendations(profile_owing_taxes)
+        
+        assert [r.title for r in again.basic_recommendations] == \
+            [r.title for r in first.basic_recommendations]
+        assert again.max_potential_savings == first.max_potential_savings
+    
     def test_hsa_recommendation_when_room(self, engine, profile_owing_taxes):
         """Should recommend HSA when there's room."""
         report = engine.generate_recommendations(profile_owing_taxes)
@@ -563,6 +793,20 @@ class TestIncomeProjector:
         # Should return YTD as-is
         assert projected == 50000
     
+    def test_project_annual_income_batch_matches_single(self):
+        """Batch projection should match the per-profile projection."""
+        profiles = [
+            UserFinancialProfile(ytd_income=50000, current_pay_period=20, pay_frequency=PayFrequency.BIWEEKLY),
+            UserFinancialProfile(ytd_income=42000, current_pay_period=7, pay_frequency=PayFrequency.MONTHLY),
+            UserFinancialProfile(ytd_income=31000, current_pay_period=30, pay_frequency=PayFrequency.WEEKLY),
+        ]
+        expected = [
+            IncomeProjector.project_annual_income(p.ytd_income, p.current_pay_period, p.pay_frequency)
+            for p in profiles
+        ]
+        
+        assert IncomeProjector.project_annual_income_batch(profiles) == expected
+    
     def test_infer_pay_frequency(self):
         """Should infer pay frequency from dates."""
         # Biweekly pattern (14 days between)
@@ -655,6 +899,37 @@ class TestIntegration:
         assert result.child_tax_credit > 0
 
 
+# =============================================================================
+# LLM CACHE TESTS
+# =============================================================================
+
+class TestLLMCache:
+    """Test the LLM response cache."""
+    
+    def test_cache_key_is_deterministic(self):
+        """Same model and messages should give the same key."""
+        messages = [{"role": "system", "content": "a"}, {"role": "user", "content": "b"}]
+        
+        assert make_cache_key("gpt", messages) == make_cache_key("gpt", list(messages))
+        assert make_cache_key("gpt", messages) != make_cache_key("other", messages)
+        assert make_cache_key("gpt", messages) != make_cache_key(
+            "gpt", messages, response_format={"type": "json_object"}
+        )
+    
+    def test_hit_miss_and_expiry(self):
+        """Entries should be served until their TTL runs out."""
+        cache = LLMCache(ttl=60)
+        assert cache.get("k") is None
+        
+        cache.set("k", {"content": "hi"})
+        assert cache.get("k") == {"content": "hi"}
+        assert (cache.hits, cache.misses) == (1, 1)
+        
+        expired = LLMCache(ttl=-1)
+        expired.set("k", {"content": "hi"})
+        assert expired.get("k") is None
+
+
 # =============================================================================
 # RUN TESTS
 # =============================================================================